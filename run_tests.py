@@ -271,7 +271,7 @@ def main():
         # Run a quick subset of tests
         cmd = base_cmd + [
             "tests/unit/test_models.py",
-            "tests/integration/test_full_workflows.py::TestCompleteArchiveWorkflow::test_create_archive_to_export_workflow",
+            "tests/integration/test_full_workflows.py::TestCompleteArchiveWorkflow",
             "-m", "not slow"
         ]
         success, output = run_command(cmd, "Quick Test Suite", args.verbose, False)
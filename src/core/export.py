@@ -1,3 +1,4 @@
+import os
 import shutil
 import tempfile
 import logging
@@ -12,6 +13,40 @@ from .search import SearchService, SearchResult
 logger = logging.getLogger(__name__)
 
 
+def _copy_file(source: Path, target: Path):
+    """shutil.copy2, but via copy_file_range where available.
+    
+    The kernel can then reflink the data on copy-on-write filesystems
+    (Btrfs, XFS) instead of duplicating it; anything it can't do falls
+    back to shutil.copy2.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                shutil.copystat(source, target)
+                return
+        except OSError:
+            pass
+    shutil.copy2(source, target)
+
+
+def _remove_stale_staging(parent: Path, prefix: str):
+    """Delete staging trees left behind by a killed export to the same destination"""
+    with os.scandir(parent) as entries:
+        stale = [Path(e.path) for e in entries if e.name.startswith(prefix) and e.is_dir(follow_symlinks=False)]
+    for path in stale:
+        logger.warning(f"Removing leftover export staging directory: {path}")
+        shutil.rmtree(path, ignore_errors=True)
+
+
 class ExportService:
     def __init__(self, archive: Archive):
         self.archive = archive
@@ -62,8 +97,15 @@ class ExportService:
         
         logger.info(f"Exporting {total} assets to BagIt format")
         
-        # Create temporary directory for bag contents
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Stage the bag beside its destination when possible so the final
+        # move is a same-filesystem rename rather than a second full copy.
+        # A process killed mid-export leaves its hidden staging tree there,
+        # so trees named for this destination are cleared out first.
+        staging_prefix = f".bagit-{output_path.name}-"
+        staging_dir = output_path.parent if os.path.isdir(output_path.parent) else None
+        if staging_dir is not None:
+            _remove_stale_staging(staging_dir, staging_prefix)
+        with tempfile.TemporaryDirectory(dir=staging_dir, prefix=staging_prefix) as temp_dir:
             temp_path = Path(temp_dir)
             bag_path = temp_path / output_path.name
             bag_path.mkdir()
@@ -87,8 +129,8 @@ class ExportService:
                 target_file = data_path / relative_path
                 target_file.parent.mkdir(parents=True, exist_ok=True)
                 
-                # Copy file
-                shutil.copy2(source_file, target_file)
+                # Copy file in-kernel, sharing extents where the filesystem can
+                _copy_file(source_file, target_file)
                 
                 # Copy metadata sidecar
                 asset = Asset(source_file, self.archive.root_path)
@@ -181,7 +223,7 @@ class ExportService:
                     counter += 1
             
             # Copy file
-            shutil.copy2(source_file, target_file)
+            _copy_file(source_file, target_file)
             
             # Copy metadata sidecar
             asset = Asset(source_file, self.archive.root_path)
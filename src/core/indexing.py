@@ -10,6 +10,19 @@ from ..models import Archive, Asset, AssetMetadata
 
 logger = logging.getLogger(__name__)
 
+# Secondary indexes, as (name, table and columns). Dropped while
+# index_all_assets rebuilds the index; _init_database recreates any that a
+# failed rebuild left missing.
+_SECONDARY_INDEXES = (
+    ("idx_assets_archive_path", "assets(archive_path)"),
+    ("idx_assets_profile_id", "assets(profile_id)"),
+    ("idx_assets_mime_type", "assets(mime_type)"),
+    ("idx_assets_checksum", "assets(checksum_sha256)"),
+    ("idx_metadata_asset_id", "asset_metadata(asset_id)"),
+    ("idx_metadata_field_name", "asset_metadata(field_name)"),
+    ("idx_metadata_field_value", "asset_metadata(field_value)"),
+)
+
 
 class IndexingService:
     def __init__(self, archive: Archive):
@@ -68,13 +81,7 @@ class IndexingService:
             """)
             
             # Create indexes for performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_archive_path ON assets(archive_path)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_profile_id ON assets(profile_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_mime_type ON assets(mime_type)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_checksum ON assets(checksum_sha256)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_asset_id ON asset_metadata(asset_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_field_name ON asset_metadata(field_name)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_field_value ON asset_metadata(field_value)")
+            self._create_indexes(conn)
             
             # Create full-text search table
             conn.execute("""
@@ -111,6 +118,29 @@ class IndexingService:
             
             conn.commit()
     
+    def _create_indexes(self, conn):
+        for name, target in _SECONDARY_INDEXES:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+    
+    @contextmanager
+    def bulk_mode(self):
+        """Drop secondary indexes during a bulk load and rebuild them once afterwards.
+        
+        Used by index_all_assets. The indexes are rebuilt even if the block
+        raises; FTS triggers are left in place so full-text content matches
+        a normal load.
+        """
+        with self._get_connection() as conn:
+            for name, _ in _SECONDARY_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+            conn.commit()
+        try:
+            yield self
+        finally:
+            with self._get_connection() as conn:
+                self._create_indexes(conn)
+                conn.commit()
+    
     def index_asset(self, asset: Asset) -> bool:
         if not asset.metadata:
             if not asset.load_metadata():
@@ -269,30 +299,32 @@ class IndexingService:
         # Find all metadata files in the archive
         metadata_files = list(self.archive.assets_path.rglob("*.metadata.json"))
         
-        for metadata_path in metadata_files:
-            try:
-                # Get the actual asset file path
-                asset_filename = metadata_path.name.replace(".metadata.json", "")
-                asset_path = metadata_path.parent / asset_filename
-                
-                if not asset_path.exists():
-                    logger.warning(f"Asset file not found for metadata: {metadata_path}")
-                    error_count += 1
-                    continue
-                
-                # Create asset instance and load metadata
-                asset = Asset(asset_path, self.archive.root_path)
-                if asset.load_metadata():
-                    if self.index_asset(asset):
-                        success_count += 1
+        # Every asset is rewritten, so build the secondary indexes once at the end
+        with self.bulk_mode():
+            for metadata_path in metadata_files:
+                try:
+                    # Get the actual asset file path
+                    asset_filename = metadata_path.name.replace(".metadata.json", "")
+                    asset_path = metadata_path.parent / asset_filename
+                    
+                    if not asset_path.exists():
+                        logger.warning(f"Asset file not found for metadata: {metadata_path}")
+                        error_count += 1
+                        continue
+                    
+                    # Create asset instance and load metadata
+                    asset = Asset(asset_path, self.archive.root_path)
+                    if asset.load_metadata():
+                        if self.index_asset(asset):
+                            success_count += 1
+                        else:
+                            error_count += 1
                     else:
                         error_count += 1
-                else:
+                        
+                except Exception as e:
+                    logger.error(f"Failed to process {metadata_path}: {e}")
                     error_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to process {metadata_path}: {e}")
-                error_count += 1
         
         logger.info(f"Indexing complete: {success_count} successful, {error_count} errors")
         return success_count, error_count
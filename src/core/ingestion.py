@@ -1,4 +1,3 @@
-import shutil
 import uuid
 import mimetypes
 from pathlib import Path
@@ -64,16 +63,12 @@ class FileIngestionService:
         if target_path.exists():
             target_path = self._handle_duplicate(target_path)
         
-        # Copy file to archive
-        logger.info(f"Copying {source_path} to {target_path}")
-        shutil.copy2(source_path, target_path)
-        
         # Create Asset instance
         asset = Asset(target_path, self.archive.root_path)
         
-        # Calculate checksum
-        logger.info(f"Calculating checksum for {target_path}")
-        checksum = asset.calculate_checksum()
+        # Copy file to archive, checksumming the data on the way through
+        logger.info(f"Copying {source_path} to {target_path}")
+        checksum = asset.copy_from(source_path)
         
         # Get file metadata
         file_stat = target_path.stat()
@@ -101,6 +96,39 @@ class FileIngestionService:
         logger.info(f"Successfully ingested {source_path} as {asset_id}")
         return asset
     
+    def ingest_files(
+        self,
+        source_paths: List[Path],
+        profile: Optional[Profile] = None,
+        custom_metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[Asset]:
+        """Ingest many files in one call; pair with IndexingService.index_assets_batch.
+
+        custom_metadata_list, when given, holds one entry per source path.
+        Files that fail are logged and skipped, as in ingest_directory.
+        """
+        if custom_metadata_list is None:
+            custom_metadata_list = [None] * len(source_paths)
+        elif len(custom_metadata_list) != len(source_paths):
+            raise ValueError("custom_metadata_list must match source_paths in length")
+        
+        assets = []
+        total_files = len(source_paths)
+        
+        for idx, (file_path, custom_metadata) in enumerate(zip(source_paths, custom_metadata_list)):
+            try:
+                self._report_progress(idx + 1, total_files, f"Ingesting {Path(file_path).name}")
+                assets.append(self.ingest_file(
+                    file_path,
+                    profile=profile,
+                    custom_metadata=custom_metadata
+                ))
+            except Exception as e:
+                logger.error(f"Failed to ingest {file_path}: {e}")
+                continue
+        
+        return assets
+    
     def ingest_directory(
         self,
         source_dir: Path,
@@ -1,4 +1,5 @@
 import logging
+import os
 import uuid
 import mimetypes
 from pathlib import Path
@@ -20,22 +21,35 @@ def _verify_asset_standalone(asset_info):
     # Construct full path
     asset_path = Path(archive_root_path) / archive_path
     
-    # Check if file exists
-    if not asset_path.exists():
-        return asset_id, "missing"
-    
     # Create asset instance
     asset = Asset(asset_path, Path(archive_root_path))
     
-    # Load metadata
+    # Load metadata; only stat the asset itself when that fails
     if not asset.load_metadata():
-        return asset_id, "no_metadata"
+        return asset_id, "no_metadata" if asset_path.exists() else "missing"
+    
+    # Verify checksum; opening the file doubles as the existence check
+    try:
+        is_valid = asset.verify_checksum()
+    except FileNotFoundError:
+        return asset_id, "missing"
     
-    # Verify checksum
-    if asset.verify_checksum():
-        return asset_id, "verified"
-    else:
-        return asset_id, "corrupted"
+    return asset_id, "verified" if is_valid else "corrupted"
+
+
+def _verify_assets_standalone(asset_infos):
+    """Verify a batch of assets in one worker task.
+
+    Per-asset failures are returned in place of the status so one bad file
+    does not discard the rest of the batch.
+    """
+    results = []
+    for asset_info in asset_infos:
+        try:
+            results.append(_verify_asset_standalone(asset_info))
+        except Exception as e:
+            results.append((asset_info[0], e))
+    return results
 
 
 class IntegrityReport:
@@ -134,11 +148,18 @@ class IntegrityService:
                     for search_result in all_assets
                 ]
                 
+                # A few batches per worker: enough to balance load while
+                # paying the per-task pickling/IPC cost once per batch
+                batch_size = max(1, -(-len(asset_info_list) // (max_workers * 4)))
+                
                 with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                    # Submit all tasks at once
+                    # Submit all batches at once
                     futures = {
-                        executor.submit(_verify_asset_standalone, asset_info): (idx, all_assets[idx])
-                        for idx, asset_info in enumerate(asset_info_list)
+                        executor.submit(
+                            _verify_assets_standalone,
+                            asset_info_list[start:start + batch_size]
+                        ): all_assets[start:start + batch_size]
+                        for start in range(0, len(asset_info_list), batch_size)
                     }
                     
                     # Process results as they complete
@@ -147,12 +168,17 @@ class IntegrityService:
                         if self._cancel_verification.is_set():
                             break
                         
-                        idx, search_result = futures[future]
-                        completed += 1
-                        self._report_progress(completed, report.total_assets, f"Verifying {search_result.file_name}")
-                        
+                        batch = futures[future]
                         try:
-                            asset_id, status = future.result()
+                            batch_results = future.result()
+                        except Exception as e:
+                            logger.error(f"Error verifying batch of {len(batch)} assets: {e}")
+                            completed += len(batch)
+                            continue
+                        
+                        for search_result, (asset_id, status) in zip(batch, batch_results):
+                            completed += 1
+                            self._report_progress(completed, report.total_assets, f"Verifying {search_result.file_name}")
                             
                             if status == "verified":
                                 report.verified_assets += 1
@@ -162,9 +188,8 @@ class IntegrityService:
                                 report.missing_assets.append(search_result.archive_path)
                             elif status == "no_metadata":
                                 report.missing_metadata.append(search_result.archive_path)
-                                
-                        except Exception as e:
-                            logger.error(f"Error verifying asset {search_result.asset_id}: {e}")
+                            elif isinstance(status, Exception):
+                                logger.error(f"Error verifying asset {asset_id}: {status}")
             
         finally:
             report.end_time = datetime.now()
@@ -175,22 +200,20 @@ class IntegrityService:
         # Construct full path
         asset_path = self.archive.root_path / archive_path
         
-        # Check if file exists
-        if not asset_path.exists():
-            return "missing"
-        
         # Create asset instance
         asset = Asset(asset_path, self.archive.root_path)
         
-        # Load metadata
+        # Load metadata; only stat the asset itself when that fails
         if not asset.load_metadata():
-            return "no_metadata"
+            return "no_metadata" if asset_path.exists() else "missing"
+        
+        # Verify checksum; opening the file doubles as the existence check
+        try:
+            is_valid = asset.verify_checksum()
+        except FileNotFoundError:
+            return "missing"
         
-        # Verify checksum
-        if asset.verify_checksum():
-            return "verified"
-        else:
-            return "corrupted"
+        return "verified" if is_valid else "corrupted"
     
     def verify_single(self, asset_id: str) -> Dict[str, Any]:
         # Find asset in index
@@ -214,25 +237,23 @@ class IntegrityService:
         }
     
     def find_orphaned_files(self) -> List[Path]:
-        orphaned = []
-        
-        # Get all files in assets directory
+        # Get all files in assets directory; os.walk uses scandir, so the
+        # file/dir split needs no stat per entry and no Path per file
         all_files = set()
-        for file_path in self.archive.assets_path.rglob("*"):
-            if file_path.is_file() and not file_path.name.endswith('.metadata.json'):
-                all_files.add(file_path)
+        for dirpath, _, filenames in os.walk(self.archive.assets_path):
+            for filename in filenames:
+                if not filename.endswith('.metadata.json'):
+                    all_files.add(os.path.join(dirpath, filename))
         
         # Get all indexed files
-        indexed_files = set()
         all_assets, _ = self.search_service.search(limit=10000)
-        for search_result in all_assets:
-            asset_path = self.archive.root_path / search_result.archive_path
-            indexed_files.add(asset_path)
+        indexed_files = {
+            str(self.archive.root_path / search_result.archive_path)
+            for search_result in all_assets
+        }
         
         # Find orphaned files (in filesystem but not in index)
-        orphaned = list(all_files - indexed_files)
-        
-        return orphaned
+        return [Path(file_path) for file_path in all_files - indexed_files]
     
     def repair_index(self) -> Dict[str, int]:
         from .indexing import IndexingService
@@ -274,9 +295,6 @@ class IntegrityService:
             else:
                 # Create new metadata and index
                 try:
-                    from ..core.ingestion import FileIngestionService
-                    ingestion_service = FileIngestionService(self.archive)
-                    
                     # Generate metadata for orphaned file
                     asset_id = str(uuid.uuid4())
                     checksum = asset.calculate_checksum()
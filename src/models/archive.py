@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from pathlib import Path
 import json
+import os
 import uuid
 from datetime import datetime
 
@@ -121,10 +122,19 @@ class Archive:
         with open(self.config_path, 'w', encoding='utf-8') as f:
             json.dump(self.config.to_dict(), f, indent=2)
     
+    def iter_profiles(self) -> Iterator[Path]:
+        """Yield profile files as the profiles directory is scanned"""
+        try:
+            entries = os.scandir(self.profiles_path)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield Path(entry.path)
+    
     def get_profiles(self) -> List[Path]:
-        if not self.profiles_path.exists():
-            return []
-        return list(self.profiles_path.glob("*.json"))
+        return list(self.iter_profiles())
     
     def get_asset_count(self) -> int:
         if not self.assets_path.exists():
@@ -2,8 +2,12 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 import json
+import sys
 from pathlib import Path
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class FieldType(Enum):
     TEXT = "text"
@@ -17,7 +21,7 @@ class FieldType(Enum):
     TAGS = "tags"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MetadataField:
     name: str
     display_name: str
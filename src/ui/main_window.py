@@ -14,7 +14,7 @@ from PyQt6.QtGui import QAction, QKeySequence, QIcon
 
 import subprocess
 import platform
-from ..models import Archive
+from ..models import Archive, Profile
 from ..utils.settings import settings
 from .search_widget import SearchWidget
 from .profile_manager import ProfileManager
@@ -468,11 +468,10 @@ class MainWindow(QMainWindow):
         
         # Load available profiles once
         try:
-            from ..models import Profile
-            profile_files = self.current_archive.get_profiles()
-            profiles = []
-            for profile_file in profile_files:
-                profiles.append(Profile.load_from_file(profile_file))
+            profiles = [
+                Profile.load_from_file(profile_file)
+                for profile_file in self.current_archive.iter_profiles()
+            ]
             
             if not profiles:
                 reply = QMessageBox.question(
@@ -728,4 +727,5 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         self.save_settings()
+        self.profile_manager.shutdown()
         event.accept()
\ No newline at end of file
@@ -1,22 +1,101 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional
 import uuid
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QTextEdit,
-    QPushButton, QListWidget, QListWidgetItem, QComboBox, QCheckBox,
+    QPushButton, QListView, QComboBox, QCheckBox,
     QGroupBox, QLabel, QMessageBox, QSplitter, QWidget, QSpinBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QAbstractListModel, QModelIndex
 
 from ..models.profile import Profile, MetadataField, FieldType
 
+# Field types that take a list of options
+_SELECTISH = frozenset({FieldType.SELECT, FieldType.MULTISELECT})
+
+# Deletes the separator characters allowed in field names
+_SEPARATORS = str.maketrans('', '', '_-')
+
+
+def _is_valid_name(name: str) -> bool:
+    """True if name is letters/numbers plus any hyphens or underscores, with at least one letter or number"""
+    stripped = name.translate(_SEPARATORS)
+    return bool(stripped) and stripped.isalnum()
+
+
+def _item_label(field: MetadataField) -> str:
+    """Text shown for a field in the fields list"""
+    return f"{field.display_name} ({field.field_type.value})"
+
+
+class FieldListModel(QAbstractListModel):
+    """List model over the MetadataFields of the profile being edited.
+    
+    Rows show the field label; the MetadataField itself is available under
+    Qt.ItemDataRole.UserRole.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fields: List[MetadataField] = []
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._fields)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        field = self._fields[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return _item_label(field)
+        if role == Qt.ItemDataRole.UserRole:
+            return field
+        return None
+    
+    def fields(self) -> List[MetadataField]:
+        return list(self._fields)
+    
+    def field(self, row: int) -> MetadataField:
+        return self._fields[row]
+    
+    def set_fields(self, fields: Iterable[MetadataField]):
+        self.beginResetModel()
+        self._fields = list(fields)
+        self.endResetModel()
+    
+    def append(self, field: MetadataField):
+        row = len(self._fields)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._fields.append(field)
+        self.endInsertRows()
+    
+    def replace(self, row: int, field: MetadataField):
+        self._fields[row] = field
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+    
+    def remove(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._fields[row]
+        self.endRemoveRows()
+
 
 class FieldEditorWidget(QWidget):
     """Widget for editing a single metadata field"""
     
+    # Delay after the last edit before live validation runs
+    VALIDATION_DELAY_MS = 150
+    
+    validation_changed = pyqtSignal(bool, str)  # valid, error message
+    
     def __init__(self, field: Optional[MetadataField] = None, parent=None):
         super().__init__(parent)
         self.field = field
+        
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.timeout.connect(self._do_validate)
+        
         self.setup_ui()
         if field:
             self.load_field(field)
@@ -68,13 +147,26 @@ class FieldEditorWidget(QWidget):
         self.validation_edit.setPlaceholderText("Optional regex pattern for validation")
         layout.addRow("Validation Pattern:", self.validation_edit)
         
+        # Live validation feedback
+        self.error_label = QLabel()
+        self.error_label.setStyleSheet("color: red;")
+        self.error_label.setWordWrap(True)
+        self.error_label.setVisible(False)
+        layout.addRow(self.error_label)
+        
+        # Re-validate once the user pauses typing
+        self.name_edit.textEdited.connect(self._schedule_validation)
+        self.display_name_edit.textEdited.connect(self._schedule_validation)
+        self.type_combo.activated.connect(self._schedule_validation)
+        self.options_edit.textChanged.connect(self._schedule_validation)
+        
         # Initially hide options field
         self.on_type_changed()
     
     def on_type_changed(self):
         """Show/hide options field based on selected type"""
         field_type = self.type_combo.currentData()
-        show_options = field_type in [FieldType.SELECT, FieldType.MULTISELECT]
+        show_options = field_type in _SELECTISH
         self.options_label.setVisible(show_options)
         self.options_edit.setVisible(show_options)
     
@@ -97,43 +189,67 @@ class FieldEditorWidget(QWidget):
             self.options_edit.setPlainText("\n".join(field.options))
         
         self.validation_edit.setText(field.validation_pattern or "")
+        
+        # Freshly loaded data is not a user edit
+        self._validate_timer.stop()
+        self.error_label.setVisible(False)
+    
+    def _schedule_validation(self):
+        self._validate_timer.start(self.VALIDATION_DELAY_MS)
     
-    def get_field(self) -> Optional[MetadataField]:
+    def _do_validate(self):
+        valid, error_msg = self.validate()
+        self.error_label.setText(error_msg)
+        self.error_label.setVisible(not valid)
+        self.validation_changed.emit(valid, error_msg)
+    
+    def form_data(self) -> Dict[str, Any]:
+        """Read every form widget once; the result can be passed to validate() and get_field()"""
+        field_type = self.type_combo.currentData()
+        return {
+            "name": self.name_edit.text().strip(),
+            "display_name": self.display_name_edit.text().strip(),
+            "field_type": field_type,
+            "required": self.required_checkbox.isChecked(),
+            "default_value": self.default_value_edit.text().strip(),
+            "description": self.description_edit.toPlainText().strip(),
+            # Only select-type fields use options; skip copying the buffer otherwise
+            "options_text": self.options_edit.toPlainText() if field_type in _SELECTISH else "",
+            "validation_pattern": self.validation_edit.text().strip(),
+        }
+    
+    def get_field(self, snapshot: Optional[Dict[str, Any]] = None) -> Optional[MetadataField]:
         """Create MetadataField from form data"""
-        name = self.name_edit.text().strip()
-        display_name = self.display_name_edit.text().strip()
+        snap = snapshot or self.form_data()
+        name = snap["name"]
+        display_name = snap["display_name"]
         
         if not name or not display_name:
             return None
         
-        field_type = self.type_combo.currentData()
-        required = self.required_checkbox.isChecked()
-        default_value = self.default_value_edit.text().strip() or None
-        description = self.description_edit.toPlainText().strip() or None
-        validation_pattern = self.validation_edit.text().strip() or None
+        field_type = snap["field_type"]
         
         # Parse options
         options = None
-        if field_type in [FieldType.SELECT, FieldType.MULTISELECT]:
-            options_text = self.options_edit.toPlainText().strip()
-            if options_text:
-                options = [line.strip() for line in options_text.split('\n') if line.strip()]
+        if field_type in _SELECTISH:
+            options = [line for line in map(str.strip, snap["options_text"].splitlines()) if line] or None
         
         return MetadataField(
             name=name,
             display_name=display_name,
             field_type=field_type,
-            required=required,
-            default_value=default_value,
+            required=snap["required"],
+            default_value=snap["default_value"] or None,
             options=options,
-            description=description,
-            validation_pattern=validation_pattern
+            description=snap["description"] or None,
+            validation_pattern=snap["validation_pattern"] or None
         )
     
-    def validate(self) -> tuple[bool, str]:
+    def validate(self, snapshot: Optional[Dict[str, Any]] = None) -> tuple[bool, str]:
         """Validate the field data"""
-        name = self.name_edit.text().strip()
-        display_name = self.display_name_edit.text().strip()
+        snap = snapshot or self.form_data()
+        name = snap["name"]
+        display_name = snap["display_name"]
         
         if not name:
             return False, "Field name is required"
@@ -142,13 +258,12 @@ class FieldEditorWidget(QWidget):
             return False, "Display name is required"
         
         # Check field name format (should be valid identifier)
-        if not name.replace('_', '').replace('-', '').isalnum():
+        if not _is_valid_name(name):
             return False, "Field name should contain only letters, numbers, hyphens, and underscores"
         
-        field_type = self.type_combo.currentData()
-        if field_type in [FieldType.SELECT, FieldType.MULTISELECT]:
-            options_text = self.options_edit.toPlainText().strip()
-            if not options_text:
+        field_type = snap["field_type"]
+        if field_type in _SELECTISH:
+            if not snap["options_text"].strip():
                 return False, f"{field_type.value.title()} fields must have at least one option"
         
         return True, ""
@@ -161,6 +276,11 @@ class ProfileEditorDialog(QDialog):
         super().__init__(parent)
         self.profile = profile
         self.existing_profiles = existing_profiles or []
+        # Names taken by other profiles, for the duplicate check on save
+        self._existing_names = {
+            p.name for p in self.existing_profiles
+            if not profile or p.id != profile.id
+        }
         self.is_editing = profile is not None
         
         self.setWindowTitle("Edit Profile" if self.is_editing else "Create Profile")
@@ -200,8 +320,10 @@ class ProfileEditorDialog(QDialog):
         fields_group = QGroupBox("Metadata Fields")
         fields_layout = QVBoxLayout(fields_group)
         
-        self.fields_list = QListWidget()
-        self.fields_list.currentItemChanged.connect(self.on_field_selected)
+        self.fields_model = FieldListModel(self)
+        self.fields_list = QListView()
+        self.fields_list.setModel(self.fields_model)
+        self.fields_list.selectionModel().currentChanged.connect(self.on_field_selected)
         fields_layout.addWidget(self.fields_list)
         
         # Field buttons
@@ -234,8 +356,9 @@ class ProfileEditorDialog(QDialog):
         editor_group = QGroupBox("Field Editor")
         editor_layout = QVBoxLayout(editor_group)
         
-        self.field_editor = FieldEditorWidget()
-        editor_layout.addWidget(self.field_editor)
+        # The field editor itself is built on first use, see field_editor
+        self._field_editor: Optional[FieldEditorWidget] = None
+        self._editor_layout = editor_layout
         
         # Field editor buttons
         editor_buttons = QHBoxLayout()
@@ -271,29 +394,35 @@ class ProfileEditorDialog(QDialog):
         dialog_buttons.addStretch()
         layout.addLayout(dialog_buttons)
         
-        # Initially hide field editor
-        self.field_editor.setEnabled(False)
+        # Initially disable field editor buttons
         self.save_field_button.setEnabled(False)
         self.cancel_field_button.setEnabled(False)
     
+    @property
+    def field_editor(self) -> FieldEditorWidget:
+        """Field editor widget, created lazily so opening the dialog stays cheap"""
+        if self._field_editor is None:
+            self._field_editor = FieldEditorWidget()
+            self._field_editor.setEnabled(False)
+            self._editor_layout.insertWidget(0, self._field_editor)
+        return self._field_editor
+    
     def load_profile(self, profile: Profile):
         """Load profile data into the dialog"""
         self.name_edit.setText(profile.name)
         self.description_edit.setPlainText(profile.description)
         
-        # Load fields
-        for field in profile.fields:
-            self.add_field_to_list(field)
+        # Load all fields in a single model reset
+        self.fields_model.set_fields(profile.fields)
+        self.on_field_selected(self.fields_list.currentIndex(), QModelIndex())
     
     def add_field_to_list(self, field: MetadataField):
         """Add a field to the fields list"""
-        item = QListWidgetItem(f"{field.display_name} ({field.field_type.value})")
-        item.setData(Qt.ItemDataRole.UserRole, field)
-        self.fields_list.addItem(item)
+        self.fields_model.append(field)
     
-    def on_field_selected(self, current: QListWidgetItem, previous: QListWidgetItem):
+    def on_field_selected(self, current: QModelIndex, previous: QModelIndex):
         """Handle field selection in the list"""
-        if current:
+        if current.isValid():
             self.edit_field_button.setEnabled(True)
             self.remove_field_button.setEnabled(True)
         else:
@@ -310,11 +439,11 @@ class ProfileEditorDialog(QDialog):
     
     def edit_field(self):
         """Edit the selected field"""
-        current_item = self.fields_list.currentItem()
-        if not current_item:
+        current = self.fields_list.currentIndex()
+        if not current.isValid():
             return
         
-        field = current_item.data(Qt.ItemDataRole.UserRole)
+        field = self.fields_model.field(current.row())
         self.field_editor.load_field(field)
         self.field_editor.setEnabled(True)
         self.save_field_button.setEnabled(True)
@@ -323,32 +452,31 @@ class ProfileEditorDialog(QDialog):
     def save_current_field(self):
         """Save the current field being edited"""
         # Validate field
-        valid, error_msg = self.field_editor.validate()
+        snapshot = self.field_editor.form_data()
+        valid, error_msg = self.field_editor.validate(snapshot)
         if not valid:
             QMessageBox.warning(self, "Invalid Field", error_msg)
             return
         
-        field = self.field_editor.get_field()
+        field = self.field_editor.get_field(snapshot)
         if not field:
             QMessageBox.warning(self, "Invalid Field", "Please fill in all required fields")
             return
         
         # Check for duplicate field names (excluding the current field being edited)
-        current_item = self.fields_list.currentItem()
-        for i in range(self.fields_list.count()):
-            item = self.fields_list.item(i)
-            if item == current_item:
+        current = self.fields_list.currentIndex()
+        current_row = current.row() if current.isValid() else -1
+        for row, existing_field in enumerate(self.fields_model.fields()):
+            if row == current_row:
                 continue
-            existing_field = item.data(Qt.ItemDataRole.UserRole)
             if existing_field.name == field.name:
                 QMessageBox.warning(self, "Duplicate Field", f"A field with name '{field.name}' already exists")
                 return
         
         # Update or add field
-        if current_item:
+        if current_row >= 0:
             # Editing existing field
-            current_item.setText(f"{field.display_name} ({field.field_type.value})")
-            current_item.setData(Qt.ItemDataRole.UserRole, field)
+            self.fields_model.replace(current_row, field)
         else:
             # Adding new field
             self.add_field_to_list(field)
@@ -358,18 +486,20 @@ class ProfileEditorDialog(QDialog):
     
     def cancel_field_edit(self):
         """Cancel field editing"""
-        self.field_editor.setEnabled(False)
+        if self._field_editor is not None:
+            self._field_editor.setEnabled(False)
         self.save_field_button.setEnabled(False)
         self.cancel_field_button.setEnabled(False)
-        self.fields_list.clearSelection()
+        if self.fields_list.selectionModel().hasSelection():
+            self.fields_list.clearSelection()
     
     def remove_field(self):
         """Remove the selected field"""
-        current_item = self.fields_list.currentItem()
-        if not current_item:
+        current = self.fields_list.currentIndex()
+        if not current.isValid():
             return
         
-        field = current_item.data(Qt.ItemDataRole.UserRole)
+        field = self.fields_model.field(current.row())
         reply = QMessageBox.question(
             self, "Remove Field",
             f"Are you sure you want to remove the field '{field.display_name}'?",
@@ -377,8 +507,14 @@ class ProfileEditorDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            row = self.fields_list.row(current_item)
-            self.fields_list.takeItem(row)
+            selection = self.fields_list.selectionModel()
+            selection.blockSignals(True)
+            try:
+                self.fields_model.remove(current.row())
+                selection.clearSelection()
+            finally:
+                selection.blockSignals(False)
+            self.on_field_selected(self.fields_list.currentIndex(), QModelIndex())
             self.cancel_field_edit()
     
     def save_profile(self):
@@ -391,25 +527,21 @@ class ProfileEditorDialog(QDialog):
             return
         
         # Check for duplicate profile names (excluding current profile)
-        for existing_profile in self.existing_profiles:
-            if existing_profile.name == name and (not self.profile or existing_profile.id != self.profile.id):
-                QMessageBox.warning(self, "Duplicate Profile", f"A profile with name '{name}' already exists")
-                return
+        if name in self._existing_names:
+            QMessageBox.warning(self, "Duplicate Profile", f"A profile with name '{name}' already exists")
+            return
         
         # Collect fields
-        fields = []
-        for i in range(self.fields_list.count()):
-            item = self.fields_list.item(i)
-            field = item.data(Qt.ItemDataRole.UserRole)
-            fields.append(field)
+        fields = self.fields_model.fields()
         
         # Create or update profile
+        now = datetime.now().isoformat()
         if self.profile:
             # Update existing profile
             self.profile.name = name
             self.profile.description = description
             self.profile.fields = fields
-            self.profile.updated_at = datetime.now().isoformat()
+            self.profile.updated_at = now
         else:
             # Create new profile
             self.profile = Profile(
@@ -417,8 +549,8 @@ class ProfileEditorDialog(QDialog):
                 name=name,
                 description=description,
                 fields=fields,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat()
+                created_at=now,
+                updated_at=now
             )
         
         self.accept()
@@ -1,19 +1,231 @@
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import queue
+import threading
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QListView,
     QPushButton, QGroupBox, QLabel, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QAbstractListModel, QModelIndex
 
-from ..models import Archive
+from ..models import Archive, Profile
 from .profile_editor_dialog import ProfileEditorDialog
 
 
+@lru_cache(maxsize=128)
+def _profile_details_html(profile_id: str, updated_at: str, name: str, description: str,
+                          created_at: str, fields: Tuple[Tuple[str, str, bool], ...]) -> str:
+    """Render the profile details panel; cached so re-selecting a profile is cheap"""
+    parts = [
+        f"<h3>{name}</h3>",
+        f"<p><b>ID:</b> {profile_id}</p>",
+        f"<p><b>Description:</b> {description or 'None'}</p>",
+        f"<p><b>Created:</b> {created_at[:10] if created_at else 'Unknown'}</p>",
+        f"<p><b>Fields:</b> {len(fields)}</p>",
+    ]
+    
+    if fields:
+        parts.append("<h4>Metadata Fields:</h4><ul>")
+        for display_name, field_type, required in fields:
+            required = " (required)" if required else ""
+            parts.append(f"<li><b>{display_name}</b> ({field_type}){required}</li>")
+        parts.append("</ul>")
+    
+    return "".join(parts)
+
+
+class ProfileLoaderThread(QThread):
+    """Scans and parses an archive's profiles off the GUI thread.
+    
+    Requests go through a single-slot queue, so a newer refresh replaces one
+    that has not started yet. The thread exits once the queue is drained and
+    is restarted by the next request; shutdown() drops anything pending and
+    waits for the current load, and must be called before the owner goes away.
+    """
+    profiles_loaded = pyqtSignal(int, object)  # request id, list of Profile
+    load_failed = pyqtSignal(int, str)         # request id, error message
+    
+    # Below this many files a thread pool costs more than it saves
+    PARALLEL_THRESHOLD = 8
+    MAX_WORKERS = 8
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requests: "queue.Queue[Tuple[int, Archive]]" = queue.Queue(maxsize=1)
+        self._lock = threading.Lock()
+        # Parsed profiles keyed by file path, invalidated by (mtime, size)
+        self._cache: Dict[Path, Tuple[Tuple[int, int], Profile]] = {}
+        self._cache_lock = threading.Lock()
+        # Picks up a request that arrived while run() was returning
+        self.finished.connect(self._start_if_pending)
+    
+    def request(self, request_id: int, archive: Archive):
+        """Queue a load of archive's profiles; never blocks the caller"""
+        with self._lock:
+            self._drain()
+            self._requests.put_nowait((request_id, archive))
+        if not self.isRunning():
+            self.start()
+    
+    def shutdown(self):
+        """Drop pending requests and wait for a load in progress to finish"""
+        with self._lock:
+            self._drain()
+        self.wait()
+    
+    def _drain(self):
+        try:
+            self._requests.get_nowait()
+        except queue.Empty:
+            pass
+    
+    def _start_if_pending(self):
+        with self._lock:
+            pending = not self._requests.empty()
+        if pending:
+            # No-op if request() already restarted the thread
+            self.start()
+    
+    def run(self):
+        while True:
+            with self._lock:
+                try:
+                    request_id, archive = self._requests.get_nowait()
+                except queue.Empty:
+                    return
+            
+            try:
+                profile_files = list(archive.iter_profiles())
+                profiles = self.load_many(profile_files)
+            except Exception as e:
+                self.load_failed.emit(request_id, str(e))
+            else:
+                self.evict(profile_files)
+                self.profiles_loaded.emit(request_id, profiles)
+    
+    def load(self, profile_file: Path) -> Profile:
+        """Load a profile, reusing the cached copy if the file is unchanged"""
+        try:
+            st = profile_file.stat()
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+        
+        with self._cache_lock:
+            cached = self._cache.get(profile_file)
+        if cached and signature is not None and cached[0] == signature:
+            return cached[1]
+        
+        profile = Profile.load_from_file(profile_file)
+        if signature is not None:
+            with self._cache_lock:
+                self._cache[profile_file] = (signature, profile)
+        return profile
+    
+    def load_many(self, profile_files: List[Path]) -> List[Profile]:
+        """Load profiles in order, reading larger batches on a thread pool"""
+        if len(profile_files) < self.PARALLEL_THRESHOLD:
+            return [self.load(profile_file) for profile_file in profile_files]
+        
+        workers = min(self.MAX_WORKERS, len(profile_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.load, profile_files))
+    
+    def invalidate(self, profile_file: Path):
+        with self._cache_lock:
+            self._cache.pop(profile_file, None)
+    
+    def evict(self, live_files: Iterable[Path]):
+        """Drop cache entries for profiles that no longer exist"""
+        live = set(live_files)
+        with self._cache_lock:
+            for stale in [p for p in self._cache if p not in live]:
+                del self._cache[stale]
+    
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+
+class ProfileListModel(QAbstractListModel):
+    """List model over Profile objects.
+    
+    Rows show the profile name; the Profile itself is available under
+    Qt.ItemDataRole.UserRole.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._profiles: List[Profile] = []
+        self._rows: Dict[str, int] = {}  # profile id -> row
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._profiles)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        profile = self._profiles[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return profile.name
+        if role == Qt.ItemDataRole.UserRole:
+            return profile
+        return None
+    
+    def set_profiles(self, profiles: Iterable[Profile]):
+        self.beginResetModel()
+        self._profiles = list(profiles)
+        self._rows = {}
+        for row, profile in enumerate(self._profiles):
+            self._rows.setdefault(profile.id, row)  # first row wins, as before
+        self.endResetModel()
+    
+    def clear(self):
+        self.set_profiles([])
+    
+    def profile(self, row: int) -> Profile:
+        return self._profiles[row]
+    
+    def profiles(self) -> List[Profile]:
+        return list(self._profiles)
+    
+    def upsert(self, profile: Profile) -> int:
+        """Replace the row with the same profile id, or append one; returns the row"""
+        row = self.row_of(profile.id)
+        if row >= 0:
+            self._profiles[row] = profile
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+        else:
+            row = len(self._profiles)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._profiles.append(profile)
+            self._rows[profile.id] = row
+            self.endInsertRows()
+        return row
+    
+    def row_of(self, profile_id: str) -> int:
+        """Row of the profile with the given id, or -1"""
+        return self._rows.get(profile_id, -1)
+
+
 class ProfileManager(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.archive: Optional[Archive] = None
         
+        # Background profile parsing; results from superseded requests are ignored
+        self.loader = ProfileLoaderThread(self)
+        self.loader.profiles_loaded.connect(self._on_profiles_loaded)
+        self.loader.load_failed.connect(self._on_profiles_failed)
+        self._load_request = 0
+        # Profiles saved while a background load is pending, merged into its result
+        self._saved_during_load: Dict[str, Profile] = {}
+        # The loader is a child, so it must be idle before Qt deletes it
+        self.destroyed.connect(self.loader.shutdown)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -23,8 +235,10 @@ class ProfileManager(QWidget):
         list_group = QGroupBox("Profiles")
         list_layout = QVBoxLayout(list_group)
         
-        self.profile_list = QListWidget()
-        self.profile_list.currentItemChanged.connect(self.on_profile_selected)
+        self.profile_model = ProfileListModel(self)
+        self.profile_list = QListView()
+        self.profile_list.setModel(self.profile_model)
+        self.profile_list.selectionModel().currentChanged.connect(self.on_profile_selected)
         list_layout.addWidget(self.profile_list)
         
         # Buttons
@@ -63,12 +277,13 @@ class ProfileManager(QWidget):
     
     def set_archive(self, archive: Optional[Archive]):
         self.archive = archive
+        self.loader.clear_cache()
         if archive:
             self.set_enabled(True)
-            self.refresh_profiles()
+            self.load_profiles_async()
         else:
             self.set_enabled(False)
-            self.profile_list.clear()
+            self.populate_profiles([])
             self.details_label.setText("No archive loaded")
     
     def set_enabled(self, enabled: bool):
@@ -76,28 +291,91 @@ class ProfileManager(QWidget):
         self.profile_list.setEnabled(enabled)
     
     def refresh_profiles(self):
+        """Reload the profile list synchronously"""
         if not self.archive:
             return
         
-        self.profile_list.clear()
+        self.populate_profiles([])
         
         try:
             profile_files = self.archive.get_profiles()
-            
-            for profile_file in profile_files:
-                from ..models import Profile
-                profile = Profile.load_from_file(profile_file)
-                
-                item = QListWidgetItem(profile.name)
-                item.setData(Qt.ItemDataRole.UserRole, profile)
-                self.profile_list.addItem(item)
-                
+            self.populate_profiles(self.loader.load_many(profile_files))
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load profiles:\n{e}")
+            return
+        
+        self.loader.evict(profile_files)
+    
+    def load_profiles_async(self):
+        """Reload the profile list, scanning and parsing the profile files in the background"""
+        if not self.archive:
+            return
+        
+        self.populate_profiles([])
+        self.loader.request(self._load_request, self.archive)
+    
+    def shutdown(self):
+        """Stop background profile loading; call before the widget is discarded"""
+        self._load_request += 1
+        self.loader.shutdown()
+    
+    def closeEvent(self, event):
+        self.shutdown()
+        super().closeEvent(event)
+    
+    def populate_profiles(self, profiles: Iterable[Profile]):
+        """Replace the listed profiles in one model reset.
+        
+        Supersedes any pending background load, so its result won't overwrite these rows.
+        """
+        self._load_request += 1
+        self._saved_during_load.clear()
+        self._set_profiles(profiles)
     
-    def on_profile_selected(self, current: QListWidgetItem, previous: QListWidgetItem):
+    def _set_profiles(self, profiles: Iterable[Profile]):
+        self.profile_model.set_profiles(profiles)
+        # A model reset drops the current row without notifying the selection model
+        self.on_profile_selected(QModelIndex(), QModelIndex())
+    
+    def current_profile(self) -> Optional[Profile]:
+        index = self.profile_list.currentIndex()
+        return self.profile_model.profile(index.row()) if index.isValid() else None
+    
+    def select_profile(self, profile_id: str):
+        row = self.profile_model.row_of(profile_id)
+        if row >= 0:
+            self.profile_list.setCurrentIndex(self.profile_model.index(row))
+    
+    def show_saved_profile(self, profile: Profile):
+        """Insert or update a just-saved profile in the list and select it"""
+        # A pending load may have read the profile before it was saved
+        self._saved_during_load[profile.id] = profile
+        index = self.profile_model.index(self.profile_model.upsert(profile))
+        if index == self.profile_list.currentIndex():
+            # Same row stays current, so currentChanged won't refresh the details
+            self.on_profile_selected(index, index)
+        else:
+            self.profile_list.setCurrentIndex(index)
+    
+    def _on_profiles_loaded(self, request_id: int, profiles: List[Profile]):
+        if request_id != self._load_request:
+            return
+        
+        current = self.current_profile()
+        self._set_profiles(profiles)
+        for profile in self._saved_during_load.values():
+            self.profile_model.upsert(profile)
+        self._saved_during_load.clear()
         if current:
-            profile = current.data(Qt.ItemDataRole.UserRole)
+            self.select_profile(current.id)
+    
+    def _on_profiles_failed(self, request_id: int, message: str):
+        if request_id == self._load_request:
+            QMessageBox.warning(self, "Error", f"Failed to load profiles:\n{message}")
+    
+    def on_profile_selected(self, current: QModelIndex, previous: QModelIndex):
+        if current.isValid():
+            profile = self.profile_model.profile(current.row())
             self.show_profile_details(profile)
             self.edit_button.setEnabled(True)
             self.delete_button.setEnabled(True)
@@ -107,20 +385,11 @@ class ProfileManager(QWidget):
             self.delete_button.setEnabled(False)
     
     def show_profile_details(self, profile):
-        details = f"<h3>{profile.name}</h3>"
-        details += f"<p><b>ID:</b> {profile.id}</p>"
-        details += f"<p><b>Description:</b> {profile.description or 'None'}</p>"
-        details += f"<p><b>Created:</b> {profile.created_at[:10] if profile.created_at else 'Unknown'}</p>"
-        details += f"<p><b>Fields:</b> {len(profile.fields)}</p>"
-        
-        if profile.fields:
-            details += "<h4>Metadata Fields:</h4><ul>"
-            for field in profile.fields:
-                required = " (required)" if field.required else ""
-                details += f"<li><b>{field.display_name}</b> ({field.field_type.value}){required}</li>"
-            details += "</ul>"
-        
-        self.details_label.setText(details)
+        fields = tuple((f.display_name, f.field_type.value, f.required) for f in profile.fields)
+        self.details_label.setText(_profile_details_html(
+            profile.id, profile.updated_at or "", profile.name,
+            profile.description, profile.created_at, fields
+        ))
     
     def new_profile(self):
         """Create a new profile"""
@@ -128,12 +397,8 @@ class ProfileManager(QWidget):
             return
         
         try:
-            # Get existing profiles for duplicate checking
-            existing_profiles = []
-            profile_files = self.archive.get_profiles()
-            for profile_file in profile_files:
-                from ..models import Profile
-                existing_profiles.append(Profile.load_from_file(profile_file))
+            # Existing profiles for duplicate checking are the ones already listed
+            existing_profiles = self.profile_model.profiles()
             
             # Open profile editor dialog
             dialog = ProfileEditorDialog(existing_profiles=existing_profiles, parent=self)
@@ -144,16 +409,8 @@ class ProfileManager(QWidget):
                     profile_file = self.archive.profiles_path / f"{profile.id}.json"
                     profile.save_to_file(profile_file)
                     
-                    # Refresh the list
-                    self.refresh_profiles()
-                    
-                    # Select the new profile
-                    for i in range(self.profile_list.count()):
-                        item = self.profile_list.item(i)
-                        item_profile = item.data(Qt.ItemDataRole.UserRole)
-                        if item_profile.id == profile.id:
-                            self.profile_list.setCurrentItem(item)
-                            break
+                    # Put the saved profile straight into the list and select it
+                    self.show_saved_profile(profile)
                     
                     QMessageBox.information(self, "Success", f"Profile '{profile.name}' created successfully.")
         
@@ -162,54 +419,41 @@ class ProfileManager(QWidget):
     
     def edit_profile(self):
         """Edit the selected profile"""
-        current_item = self.profile_list.currentItem()
-        if not current_item or not self.archive:
+        profile = self.current_profile()
+        if not profile or not self.archive:
             return
         
+        profile_file = self.archive.profiles_path / f"{profile.id}.json"
+        
         try:
-            profile = current_item.data(Qt.ItemDataRole.UserRole)
+            # Existing profiles for duplicate checking (excluding current one)
+            existing_profiles = [p for p in self.profile_model.profiles() if p.id != profile.id]
             
-            # Get existing profiles for duplicate checking (excluding current one)
-            existing_profiles = []
-            profile_files = self.archive.get_profiles()
-            for profile_file in profile_files:
-                from ..models import Profile
-                existing_profile = Profile.load_from_file(profile_file)
-                if existing_profile.id != profile.id:
-                    existing_profiles.append(existing_profile)
-            
-            # Open profile editor dialog
-            dialog = ProfileEditorDialog(profile=profile, existing_profiles=existing_profiles, parent=self)
+            # Open profile editor dialog on a copy; the listed profile is shared
+            # with the loader cache and must only change once the save succeeds
+            dialog = ProfileEditorDialog(profile=Profile.from_dict(profile.to_dict()),
+                                         existing_profiles=existing_profiles, parent=self)
             if dialog.exec() == ProfileEditorDialog.DialogCode.Accepted:
                 updated_profile = dialog.get_profile()
                 if updated_profile:
                     # Save updated profile to file
-                    profile_file = self.archive.profiles_path / f"{updated_profile.id}.json"
                     updated_profile.save_to_file(profile_file)
                     
-                    # Refresh the list
-                    self.refresh_profiles()
-                    
-                    # Select the updated profile
-                    for i in range(self.profile_list.count()):
-                        item = self.profile_list.item(i)
-                        item_profile = item.data(Qt.ItemDataRole.UserRole)
-                        if item_profile.id == updated_profile.id:
-                            self.profile_list.setCurrentItem(item)
-                            break
+                    # Put the saved profile straight into the list and select it
+                    self.show_saved_profile(updated_profile)
                     
                     QMessageBox.information(self, "Success", f"Profile '{updated_profile.name}' updated successfully.")
         
         except Exception as e:
+            # A failed save may have truncated the file; re-read it next time
+            self.loader.invalidate(profile_file)
             QMessageBox.critical(self, "Error", f"Failed to edit profile:\n{e}")
     
     def delete_profile(self):
-        current_item = self.profile_list.currentItem()
-        if not current_item:
+        profile = self.current_profile()
+        if not profile:
             return
         
-        profile = current_item.data(Qt.ItemDataRole.UserRole)
-        
         reply = QMessageBox.question(
             self, "Delete Profile",
             f"Are you sure you want to delete the profile '{profile.name}'?\n"
@@ -221,6 +465,7 @@ class ProfileManager(QWidget):
             try:
                 profile_file = self.archive.profiles_path / f"{profile.id}.json"
                 profile_file.unlink()
+                self.loader.invalidate(profile_file)
                 self.refresh_profiles()
                 QMessageBox.information(self, "Success", f"Profile '{profile.name}' deleted.")
                 
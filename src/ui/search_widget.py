@@ -1,13 +1,96 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
+    QTableView, QHeaderView, QComboBox,
     QLabel, QSpinBox, QGroupBox, QFormLayout
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
 
 from ..models import Archive
-from ..core.search import SearchService
+from ..core.search import SearchService, SearchResult
+
+
+# Rows sampled when sizing result columns to their contents
+RESIZE_SAMPLE_ROWS = 200
+
+
+def _format_size(size_bytes: int) -> str:
+    if size_bytes == 0:
+        return "0 B"
+    
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
+    
+    return f"{size_bytes:.1f} PB"
+
+
+class SearchResultsModel(QAbstractTableModel):
+    """Table model over a list of SearchResults.
+    
+    Cells are produced on demand in data(), so only rows the view actually
+    paints are formatted; each row's strings are kept until the next reset.
+    """
+    HEADERS = ["Name", "Size", "Type", "Created", "Checksum", "Path"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results: List[SearchResult] = []
+        self._row_texts: List[Optional[Tuple[str, ...]]] = []
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._results)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        result = self._results[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._row_text(index.row())[column]
+        elif role == Qt.ItemDataRole.ToolTipRole and column == 4:
+            return result.checksum_sha256 or None
+        elif role == Qt.ItemDataRole.UserRole:
+            # Raw values for callers; the size column keeps its byte count
+            return result.file_size if column == 1 else result
+        
+        return None
+    
+    def _row_text(self, row: int) -> Tuple[str, ...]:
+        """Display strings for a row, built on first paint and then reused"""
+        text = self._row_texts[row]
+        if text is None:
+            result = self._results[row]
+            text = self._row_texts[row] = (
+                result.file_name,
+                _format_size(result.file_size),
+                result.mime_type or "Unknown",
+                result.created_at[:10],  # Just date
+                # Checksum (first 16 chars)
+                result.checksum_sha256[:16] + "..." if result.checksum_sha256 else "",
+                result.archive_path,
+            )
+        return text
+    
+    def set_results(self, results: List[SearchResult]):
+        self.beginResetModel()
+        self._results = list(results)
+        self._row_texts = [None] * len(self._results)
+        self.endResetModel()
+    
+    def result(self, row: int) -> SearchResult:
+        return self._results[row]
 
 
 class SearchWidget(QWidget):
@@ -75,23 +158,24 @@ class SearchWidget(QWidget):
         results_group = QGroupBox("Results")
         results_layout = QVBoxLayout(results_group)
         
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels([
-            "Name", "Size", "Type", "Created", "Checksum", "Path"
-        ])
+        self.results_model = SearchResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         
         # Configure table
+        # Columns 0-4 are sized once per result set in populate_results rather
+        # than re-measured by ResizeToContents on every layout pass
         header = self.results_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        for column in range(5):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
+        header.setResizeContentsPrecision(RESIZE_SAMPLE_ROWS)
+        
+        # Fixed row heights; never measure every row's contents
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
         self.results_table.setAlternatingRowColors(True)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.results_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         
         results_layout.addWidget(self.results_table)
         
@@ -180,53 +264,14 @@ class SearchWidget(QWidget):
             self.results_info.setText(f"Search error: {e}")
     
     def populate_results(self, results, total, query):
-        self.results_table.setRowCount(len(results))
-        
-        for row, result in enumerate(results):
-            # Name
-            name_item = QTableWidgetItem(result.file_name)
-            name_item.setData(Qt.ItemDataRole.UserRole, result)
-            self.results_table.setItem(row, 0, name_item)
-            
-            # Size
-            size_item = QTableWidgetItem(self._format_size(result.file_size))
-            size_item.setData(Qt.ItemDataRole.UserRole, result.file_size)
-            self.results_table.setItem(row, 1, size_item)
-            
-            # Type
-            type_item = QTableWidgetItem(result.mime_type or "Unknown")
-            self.results_table.setItem(row, 2, type_item)
-            
-            # Created
-            created_item = QTableWidgetItem(result.created_at[:10])  # Just date
-            self.results_table.setItem(row, 3, created_item)
-            
-            # Checksum (first 16 chars)
-            checksum_text = result.checksum_sha256[:16] + "..." if result.checksum_sha256 else ""
-            checksum_item = QTableWidgetItem(checksum_text)
-            if result.checksum_sha256:
-                checksum_item.setToolTip(result.checksum_sha256)
-            self.results_table.setItem(row, 4, checksum_item)
-            
-            # Path
-            path_item = QTableWidgetItem(result.archive_path)
-            self.results_table.setItem(row, 5, path_item)
+        self.results_model.set_results(results)
+        if results:
+            self.results_table.resizeColumnsToContents()
         
         # Update info label
         query_text = f" for '{query}'" if query else ""
         self.results_info.setText(f"Found {total} results{query_text} (showing {len(results)})")
     
     def clear_results(self):
-        self.results_table.setRowCount(0)
+        self.results_model.set_results([])
         self.results_info.setText("No search performed")
-    
-    def _format_size(self, size_bytes: int) -> str:
-        if size_bytes == 0:
-            return "0 B"
-        
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        
-        return f"{size_bytes:.1f} PB"
\ No newline at end of file
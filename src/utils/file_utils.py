@@ -1,10 +1,16 @@
-import re
 import os
 from pathlib import Path
 from typing import Dict, Any
 import mimetypes
 
 
+_UNSAFE_CHARS = '<>:"/\\|?*' + ''.join(map(chr, range(0x20)))
+# Replaces each unsafe character with '_'
+_REPLACE_UNSAFE = str.maketrans(dict.fromkeys(_UNSAFE_CHARS, '_'))
+# Drops unsafe characters along with the dots and spaces that get stripped
+_DROP_UNSAFE = str.maketrans('', '', _UNSAFE_CHARS + '. ')
+
+
 def safe_filename(filename: str, max_length: int = 255) -> str:
     # Handle None input
     if filename is None:
@@ -16,12 +22,10 @@ def safe_filename(filename: str, max_length: int = 255) -> str:
     
     # Check if filename becomes empty after removing unsafe chars (before replacement)
     # This handles cases like "///" which should become "unnamed", not "___"
-    temp_safe = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '', filename)
-    temp_safe = temp_safe.strip('. ')
-    will_be_empty = not temp_safe
+    will_be_empty = not filename.translate(_DROP_UNSAFE)
     
     # Remove or replace unsafe characters
-    safe = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+    safe = filename.translate(_REPLACE_UNSAFE)
     
     # Handle edge case: only extension (keep it)
     if safe.startswith('.') and len(safe) > 1 and '.' not in safe[1:]:
@@ -70,10 +74,9 @@ def create_directory_structure(base_path: Path, structure: str) -> Path:
     has_trailing_slash = structure.endswith('/')
     parts = [part for part in parts if part.strip()]
     
-    path = base_path
-    
-    for part in parts:
-        path = path / part
+    # One mkdir on the leaf creates any missing parents along the way
+    path = base_path.joinpath(*parts)
+    if parts:
         path.mkdir(parents=True, exist_ok=True)
     
     # If there was a trailing slash, return a path inside the last created directory
@@ -91,7 +94,8 @@ def get_file_info(file_path) -> Dict[str, Any]:
         file_path = Path(file_path)
     
     stat = file_path.stat()
-    mime_type, encoding = mimetypes.guess_type(str(file_path))
+    # Only the name matters for guessing; the full path would be URL-parsed
+    mime_type, encoding = mimetypes.guess_type(file_path.name)
     
     return {
         "name": file_path.name,
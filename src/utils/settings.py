@@ -1,24 +1,30 @@
 import json
 import logging
+import os
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
 class Settings:
+    # Seconds a recent archive's existence check is trusted before re-checking
+    EXISTS_TTL = 2.0
+    
     def __init__(self):
         self.settings_file = Path.home() / ".archive_tool" / "settings.json"
         self.settings_file.parent.mkdir(exist_ok=True)
         self._settings: Dict[str, Any] = {}
+        self._exists_cache: Dict[str, Tuple[float, bool]] = {}
         self.load_settings()
     
     def load_settings(self):
         """Load settings from file."""
         try:
             if self.settings_file.exists():
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    self._settings = json.load(f)
+                with open(self.settings_file, 'rb', buffering=65536) as f:
+                    self._settings = json.loads(f.read())
                 logger.info(f"Loaded settings from {self.settings_file}")
             else:
                 self._settings = self.get_default_settings()
@@ -29,12 +35,17 @@ class Settings:
             self._settings = self.get_default_settings()
     
     def save_settings(self):
-        """Save settings to file."""
+        """Save settings to file atomically via a temp file and os.replace."""
+        tmp_file = self.settings_file.with_suffix('.json.tmp')
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2)
+            data = json.dumps(self._settings, indent=2).encode('utf-8')
+            with open(tmp_file, 'wb', buffering=65536) as f:
+                f.write(data)
+            os.replace(tmp_file, self.settings_file)
             logger.info(f"Saved settings to {self.settings_file}")
         except Exception as e:
+            # Don't leave a partial temp file beside the settings
+            tmp_file.unlink(missing_ok=True)
             logger.error(f"Failed to save settings: {e}")
     
     def get_default_settings(self) -> Dict[str, Any]:
@@ -68,19 +79,16 @@ class Settings:
     
     def add_recent_archive(self, archive_path: Path):
         """Add an archive to the recent archives list."""
-        recent = self.get("recent_archives", [])
         archive_str = str(archive_path)
-        
-        # Remove if already exists
-        if archive_str in recent:
-            recent.remove(archive_str)
-        
-        # Add to beginning
-        recent.insert(0, archive_str)
-        
-        # Limit to max recent
         max_recent = self.get("max_recent_archives", 10)
+        
+        # Move to the front in a single pass, dropping any older duplicate
+        recent = [archive_str] + [
+            p for p in self.get("recent_archives", []) if p != archive_str
+        ]
         recent = recent[:max_recent]
+        # The archive may have just been created; don't trust an old miss
+        self._exists_cache.pop(archive_str, None)
         
         self.set("recent_archives", recent)
         self.save_settings()
@@ -88,7 +96,18 @@ class Settings:
     def get_recent_archives(self) -> list[Path]:
         """Get list of recent archive paths."""
         recent = self.get("recent_archives", [])
-        return [Path(p) for p in recent if Path(p).exists()]
+        now = time.monotonic()
+        existing = []
+        for p in recent:
+            cached = self._exists_cache.get(p)
+            if cached and now - cached[0] < self.EXISTS_TTL:
+                exists = cached[1]
+            else:
+                exists = os.path.exists(p)
+                self._exists_cache[p] = (now, exists)
+            if exists:
+                existing.append(Path(p))
+        return existing
     
     def remove_recent_archive(self, archive_path: Path):
         """Remove an archive from recent archives."""
@@ -6,8 +6,13 @@ import pytest
 import tempfile
 import shutil
 import os
+import atexit
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
+from contextlib import contextmanager
 import json
 
 from src.models import Archive, Profile, MetadataField, FieldType
@@ -16,6 +21,64 @@ from src.models import Archive, Profile, MetadataField, FieldType
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
 
 
+def _fast_temp_root():
+    """Use RAM-backed /dev/shm for temp dirs when it is writable and roomy.
+    
+    Container defaults can be as small as 64 MB, so require some headroom
+    before preferring it over the regular temp location.
+    """
+    shm = "/dev/shm"
+    try:
+        st = os.statvfs(shm)
+    except (OSError, AttributeError):
+        return None
+    if os.access(shm, os.W_OK) and st.f_bavail * st.f_frsize >= 512 * 1024 * 1024:
+        return shm
+    return None
+
+
+FAST_TEMP_ROOT = _fast_temp_root()
+
+# Deletes discarded temp trees off the test's critical path; shut down (and
+# waited on) at interpreter exit so nothing is left half-removed.
+_CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-cleanup")
+atexit.register(_CLEANUP_EXECUTOR.shutdown, wait=True)
+
+
+def _discard_tree(path: Path):
+    """Move a directory aside with one rename and delete it in the background"""
+    trash = path.parent / f".trash-{uuid.uuid4().hex}"
+    try:
+        path.rename(trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    _CLEANUP_EXECUTOR.submit(shutil.rmtree, trash, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_test_databases():
+    """Skip fsyncs on the throwaway index databases tests create.
+    
+    Journal mode stays WAL, as production uses it and tests check it; only
+    durability, which a temp database never needs, is relaxed.
+    """
+    from src.core.indexing import IndexingService
+    
+    original = IndexingService._get_connection
+    
+    @contextmanager
+    def _get_connection(self):
+        with original(self) as conn:
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            yield conn
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(IndexingService, "_get_connection", _get_connection)
+        yield
+
+
 @pytest.fixture(scope="session")
 def qt_app():
     """Create QApplication instance for UI tests"""
@@ -59,83 +122,93 @@ def qt_widget(qt_app):
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests"""
-    temp_path = Path(tempfile.mkdtemp())
+    temp_path = Path(tempfile.mkdtemp(dir=FAST_TEMP_ROOT))
     yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+    _discard_tree(temp_path)
+
+
+@pytest.fixture(scope="session")
+def template_index_db(tmp_path_factory):
+    """Bytes of an index database whose schema has already been created"""
+    from src.core.indexing import IndexingService
+    
+    archive = Archive(tmp_path_factory.mktemp("template_archive") / "archive")
+    archive.create("Template Archive")
+    indexing = IndexingService(archive)
+    # The last connection has closed, so the WAL is checkpointed into the file
+    return indexing.db_path.read_bytes()
 
 
 @pytest.fixture
-def sample_archive(temp_dir):
+def sample_archive(temp_dir, template_index_db):
     """Create a sample archive for testing"""
     archive_path = temp_dir / "test_archive"
     archive = Archive(archive_path)
     archive.create("Test Archive", "Test archive for unit tests")
+    # Start from the prebuilt schema instead of running the DDL per test
+    (archive.index_path / "index.db").write_bytes(template_index_db)
     yield archive
     # Cleanup handled by temp_dir fixture
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_profile():
-    """Create a sample metadata profile"""
-    profile = Profile(
+    """Create a sample metadata profile (session-scoped; treat as read-only)"""
+    now = datetime.now().isoformat()
+    return Profile(
         id="test_profile",
         name="Test Profile",
         description="Profile for testing",
-        created_at=datetime.now().isoformat(),
-        updated_at=datetime.now().isoformat()
+        fields=[
+            MetadataField(
+                name="title",
+                display_name="Title",
+                field_type=FieldType.TEXT,
+                required=True
+            ),
+            MetadataField(
+                name="description",
+                display_name="Description",
+                field_type=FieldType.TEXTAREA
+            ),
+            MetadataField(
+                name="tags",
+                display_name="Tags",
+                field_type=FieldType.TAGS
+            ),
+            MetadataField(
+                name="category",
+                display_name="Category",
+                field_type=FieldType.SELECT,
+                options=["Document", "Image", "Video", "Other"]
+            ),
+        ],
+        created_at=now,
+        updated_at=now
     )
-    
-    profile.add_field(MetadataField(
-        name="title",
-        display_name="Title",
-        field_type=FieldType.TEXT,
-        required=True
-    ))
-    
-    profile.add_field(MetadataField(
-        name="description",
-        display_name="Description",
-        field_type=FieldType.TEXTAREA
-    ))
-    
-    profile.add_field(MetadataField(
-        name="tags",
-        display_name="Tags",
-        field_type=FieldType.TAGS
-    ))
-    
-    profile.add_field(MetadataField(
-        name="category",
-        display_name="Category",
-        field_type=FieldType.SELECT,
-        options=["Document", "Image", "Video", "Other"]
-    ))
-    
-    return profile
 
 
-@pytest.fixture
-def sample_files(temp_dir):
-    """Create sample files for testing"""
-    files_dir = temp_dir / "sample_files"
-    files_dir.mkdir()
+@pytest.fixture(scope="session")
+def sample_files(tmp_path_factory):
+    """Create sample files for testing (session-scoped; treat as read-only)"""
+    files_dir = tmp_path_factory.mktemp("sample_files")
     
     files = []
     
     # Text files
     for i in range(3):
         file_path = files_dir / f"document_{i+1}.txt"
-        with open(file_path, 'w') as f:
-            f.write(f"This is test document {i+1}\n")
-            f.write(f"Created for testing purposes\n")
-            f.write(f"Content: Lorem ipsum dolor sit amet\n")
+        file_path.write_text(
+            f"This is test document {i+1}\n"
+            "Created for testing purposes\n"
+            "Content: Lorem ipsum dolor sit amet\n"
+        )
         files.append(file_path)
     
     # Binary file (simulate image)
     binary_path = files_dir / "image.jpg"
-    with open(binary_path, 'wb') as f:
-        f.write(b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01')  # JPEG header
-        f.write(b'fake image data for testing' * 100)
+    jpeg_header = b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01'
+    binary_path.write_bytes(jpeg_header + b'fake image data for testing' * 100)
     files.append(binary_path)
     
     # JSON file
@@ -153,20 +226,19 @@ def large_sample_files(temp_dir):
     files_dir = temp_dir / "large_sample"
     files_dir.mkdir()
     
-    files = []
-    
-    # Create 100 files in subdirectories
+    # Create 100 files in subdirectories; directories first, then the
+    # writes fan out over a small thread pool (file I/O releases the GIL)
     for i in range(10):
-        subdir = files_dir / f"dir_{i}"
-        subdir.mkdir()
-        
-        for j in range(10):
-            file_path = subdir / f"file_{i}_{j}.txt"
-            with open(file_path, 'w') as f:
-                f.write(f"File {i}-{j} content\n" * 50)  # Make files larger
-            files.append(file_path)
+        (files_dir / f"dir_{i}").mkdir()
     
-    return files
+    def write_file(pair):
+        i, j = pair
+        file_path = files_dir / f"dir_{i}" / f"file_{i}_{j}.txt"
+        file_path.write_bytes((f"File {i}-{j} content\n" * 50).encode())
+        return file_path
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(write_file, [(i, j) for i in range(10) for j in range(10)]))
 
 
 @pytest.fixture
@@ -200,48 +272,69 @@ def archive_with_assets(sample_archive, sample_files, sample_profile, sample_met
         metadata["title"] = f"Test File {i+1}"
         
         asset = ingestion.ingest_file(file_path, profile=sample_profile, custom_metadata=metadata)
-        indexing.index_asset(asset)
         assets.append(asset)
     
+    # Index everything in one transaction rather than one commit per asset
+    assert indexing.index_assets_batch(assets)
+    
     return sample_archive, assets
 
 
-@pytest.fixture(scope="session")
-def performance_archive(tmp_path_factory):
-    """Large archive for performance testing (session-scoped)"""
-    temp_path = tmp_path_factory.mktemp("perf_archive")
+@contextmanager
+def _new_performance_archive(template_index_db):
+    """Create an empty performance archive and its profile; discarded on exit"""
+    temp_path = Path(tempfile.mkdtemp(prefix="perf_archive", dir=FAST_TEMP_ROOT))
     archive_path = temp_path / "performance_archive"
     
     archive = Archive(archive_path)
     archive.create("Performance Test Archive", "Large archive for performance testing")
+    (archive.index_path / "index.db").write_bytes(template_index_db)
     
     # Create profile
+    now = datetime.now().isoformat()
     profile = Profile(
         id="perf_profile",
         name="Performance Profile",
         description="Profile for performance testing",
-        created_at=datetime.now().isoformat(),
-        updated_at=datetime.now().isoformat()
+        fields=[
+            MetadataField(
+                name="title",
+                display_name="Title",
+                field_type=FieldType.TEXT,
+                required=True
+            ),
+            MetadataField(
+                name="category",
+                display_name="Category",
+                field_type=FieldType.SELECT,
+                options=["Type1", "Type2", "Type3"]
+            ),
+        ],
+        created_at=now,
+        updated_at=now
     )
     
-    profile.add_field(MetadataField(
-        name="title",
-        display_name="Title",
-        field_type=FieldType.TEXT,
-        required=True
-    ))
-    
-    profile.add_field(MetadataField(
-        name="category",
-        display_name="Category", 
-        field_type=FieldType.SELECT,
-        options=["Type1", "Type2", "Type3"]
-    ))
-    
     profile_path = archive.profiles_path / f"{profile.id}.json"
     profile.save_to_file(profile_path)
     
-    yield archive, profile
+    try:
+        yield archive, profile
+    finally:
+        _discard_tree(temp_path)
+
+
+@pytest.fixture(scope="session")
+def performance_archive(template_index_db):
+    """Large archive for performance testing (session-scoped, RAM-backed when possible)"""
+    with _new_performance_archive(template_index_db) as archive_and_profile:
+        yield archive_and_profile
+
+
+@pytest.fixture(scope="session")
+def performance_archive_factory(template_index_db):
+    """Factory for fresh, empty performance archives.
     
-    # Cleanup
-    shutil.rmtree(temp_path, ignore_errors=True)
\ No newline at end of file
+    Each call returns a context manager yielding (archive, profile), for tests
+    that must not share the contents of performance_archive.
+    """
+    return partial(_new_performance_archive, template_index_db)
@@ -4,121 +4,166 @@ Integration tests for database operations and data consistency
 
 import pytest
 import sqlite3
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
 from src.core.indexing import IndexingService
 from src.core.search import SearchService
-from src.models import Asset, AssetMetadata
+from src.models import Archive, Asset, AssetMetadata
+
+
+class MemoryIndexingService(IndexingService):
+    """IndexingService whose database is a named shared-cache in-memory DB.
+    
+    Connections only mirror the foreign key setting; checks of the production
+    connection setup belong on a real IndexingService.
+    """
+    
+    def __init__(self, archive, uri: str):
+        self.uri = uri
+        super().__init__(archive)
+    
+    @contextmanager
+    def _get_connection(self):
+        conn = sqlite3.connect(self.uri, uri=True, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            yield conn
+        finally:
+            conn.close()
 
 
 @pytest.mark.integration
 class TestDatabaseIntegration:
     """Test database operations and data consistency"""
     
-    def test_database_initialization(self, sample_archive):
+    @pytest.fixture
+    def indexing(self, sample_archive):
+        """Indexing service over the sample archive, shared by a test's steps"""
+        return IndexingService(sample_archive)
+    
+    @pytest.fixture
+    def memory_indexing(self, temp_dir):
+        """Indexing service backed by RAM, for tests that only check constraints or queries"""
+        uri = f"file:archive_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        # The in-memory database lives only while a connection to it is open
+        keeper = sqlite3.connect(uri, uri=True)
+        # Nothing is read from the archive directory, so it is never created
+        yield MemoryIndexingService(Archive(temp_dir / "memory_archive"), uri)
+        keeper.close()
+    
+    @pytest.fixture
+    def conn(self, memory_indexing):
+        """One open connection for the whole test; uncommitted work is discarded"""
+        with memory_indexing._get_connection() as conn:
+            yield conn
+            conn.rollback()
+    
+    def test_database_initialization(self, temp_dir):
         """Test that database is properly initialized with correct schema"""
         
-        indexing = IndexingService(sample_archive)
+        # A fresh archive, not sample_archive: that one is seeded with a
+        # prebuilt index database, so nothing would be left to create
+        archive = Archive(temp_dir / "fresh_archive")
+        archive.create("Fresh Archive")
+        assert not (archive.index_path / "index.db").exists()
+        
+        indexing = IndexingService(archive)
         
         # Check that database file exists
         assert indexing.db_path.exists()
         
-        # Check that tables exist with correct schema
+        # Read the schema objects and both tables' columns in two queries
         with indexing._get_connection() as conn:
-            # Get table info
-            tables = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            ).fetchall()
-            
-            table_names = [row[0] for row in tables]
-            
-            # Verify core tables exist
-            assert 'assets' in table_names
-            assert 'asset_metadata' in table_names
-            assert 'assets_fts' in table_names
-            
-            # Check assets table schema
-            assets_schema = conn.execute("PRAGMA table_info(assets)").fetchall()
-            column_names = [row[1] for row in assets_schema]
-            
-            expected_columns = [
-                'asset_id', 'original_path', 'archive_path', 'file_name',
-                'file_size', 'mime_type', 'checksum_sha256', 'checksum_verified_at',
-                'profile_id', 'created_at', 'updated_at', 'indexed_at'
-            ]
-            
-            for col in expected_columns:
-                assert col in column_names
-            
-            # Check asset_metadata table schema
-            metadata_schema = conn.execute("PRAGMA table_info(asset_metadata)").fetchall()
-            metadata_columns = [row[1] for row in metadata_schema]
-            
-            expected_metadata_columns = [
-                'id', 'asset_id', 'field_name', 'field_value', 'field_type'
-            ]
-            
-            for col in expected_metadata_columns:
-                assert col in metadata_columns
-            
-            # Check indexes exist
-            indexes = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='index'"
+            schema_rows = conn.execute(
+                "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index', 'trigger')"
             ).fetchall()
-            
-            index_names = [row[0] for row in indexes]
-            
-            # Verify important indexes exist
-            assert any('assets_archive_path' in name for name in index_names)
-            assert any('metadata_asset_id' in name for name in index_names)
+            column_rows = conn.execute("""
+                SELECT 'assets', name FROM pragma_table_info('assets')
+                UNION ALL
+                SELECT 'asset_metadata', name FROM pragma_table_info('asset_metadata')
+            """).fetchall()
+        
+        table_names = {name for kind, name in schema_rows if kind == 'table'}
+        index_names = [name for kind, name in schema_rows if kind == 'index']
+        trigger_names = {name for kind, name in schema_rows if kind == 'trigger'}
+        column_names = [name for table, name in column_rows if table == 'assets']
+        metadata_columns = [name for table, name in column_rows if table == 'asset_metadata']
+        
+        # Verify core tables exist
+        assert 'assets' in table_names
+        assert 'asset_metadata' in table_names
+        assert 'assets_fts' in table_names
+        
+        # Check assets table schema
+        expected_columns = [
+            'asset_id', 'original_path', 'archive_path', 'file_name',
+            'file_size', 'mime_type', 'checksum_sha256', 'checksum_verified_at',
+            'profile_id', 'created_at', 'updated_at', 'indexed_at'
+        ]
+        
+        for col in expected_columns:
+            assert col in column_names
+        
+        # Check asset_metadata table schema
+        expected_metadata_columns = [
+            'id', 'asset_id', 'field_name', 'field_value', 'field_type'
+        ]
+        
+        for col in expected_metadata_columns:
+            assert col in metadata_columns
+        
+        # Verify important indexes exist
+        assert any('assets_archive_path' in name for name in index_names)
+        assert any('metadata_asset_id' in name for name in index_names)
+        
+        # The FTS index is kept in sync by triggers
+        assert {'assets_fts_insert', 'assets_fts_update', 'assets_fts_delete'} <= trigger_names
     
-    def test_foreign_key_constraints(self, sample_archive):
+    def test_foreign_key_constraints(self, indexing, conn):
         """Test that foreign key constraints are properly enforced"""
         
-        indexing = IndexingService(sample_archive)
-        
-        with indexing._get_connection() as conn:
-            # Check foreign keys are enabled
-            fk_result = conn.execute("PRAGMA foreign_keys").fetchone()
-            assert fk_result[0] == 1  # Foreign keys should be ON
-            
-            # Insert test asset
-            asset_id = "test-fk-asset"
-            conn.execute("""
-                INSERT INTO assets (
-                    asset_id, original_path, archive_path, file_name, file_size,
-                    created_at, updated_at, indexed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (asset_id, "/test", "test.txt", "test.txt", 100, "2024-01-01", "2024-01-01", "2024-01-01"))
-            
-            # Insert metadata referencing the asset
-            conn.execute("""
-                INSERT INTO asset_metadata (asset_id, field_name, field_value, field_type)
-                VALUES (?, ?, ?, ?)
-            """, (asset_id, "title", "Test Asset", "str"))
-            
-            conn.commit()
-            
-            # Verify metadata was inserted
-            metadata_count = conn.execute(
-                "SELECT COUNT(*) FROM asset_metadata WHERE asset_id = ?",
-                (asset_id,)
-            ).fetchone()[0]
-            
-            assert metadata_count == 1
-            
-            # Delete asset (should cascade to metadata due to foreign key)
-            conn.execute("DELETE FROM assets WHERE asset_id = ?", (asset_id,))
-            conn.commit()
-            
-            # Verify metadata was also deleted
-            metadata_count_after = conn.execute(
-                "SELECT COUNT(*) FROM asset_metadata WHERE asset_id = ?",
-                (asset_id,)
-            ).fetchone()[0]
-            
-            assert metadata_count_after == 0
+        # Check the production connection setup enables foreign keys
+        with indexing._get_connection() as real_conn:
+            fk_result = real_conn.execute("PRAGMA foreign_keys").fetchone()
+        assert fk_result[0] == 1  # Foreign keys should be ON
+        
+        # Insert test asset
+        asset_id = "test-fk-asset"
+        conn.execute("""
+            INSERT INTO assets (
+                asset_id, original_path, archive_path, file_name, file_size,
+                created_at, updated_at, indexed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (asset_id, "/test", "test.txt", "test.txt", 100, "2024-01-01", "2024-01-01", "2024-01-01"))
+        
+        # Insert metadata referencing the asset
+        conn.execute("""
+            INSERT INTO asset_metadata (asset_id, field_name, field_value, field_type)
+            VALUES (?, ?, ?, ?)
+        """, (asset_id, "title", "Test Asset", "str"))
+        
+        # Verify metadata was inserted
+        metadata_count = conn.execute(
+            "SELECT COUNT(*) FROM asset_metadata WHERE asset_id = ?",
+            (asset_id,)
+        ).fetchone()[0]
+        
+        assert metadata_count == 1
+        
+        # Delete asset (should cascade to metadata due to foreign key)
+        conn.execute("DELETE FROM assets WHERE asset_id = ?", (asset_id,))
+        
+        # Verify metadata was also deleted
+        metadata_count_after = conn.execute(
+            "SELECT COUNT(*) FROM asset_metadata WHERE asset_id = ?",
+            (asset_id,)
+        ).fetchone()[0]
+        
+        assert metadata_count_after == 0
     
     def test_full_text_search_integration(self, archive_with_assets):
         """Test FTS integration with main tables"""
@@ -142,8 +187,6 @@ class TestDatabaseIntegration:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (test_asset_id, "/fts/test", "fts_test.txt", "fts_test.txt", 100, "2024-01-01", "2024-01-01", "2024-01-01"))
             
-            conn.commit()
-            
             # Verify FTS was updated
             fts_count_after = conn.execute("SELECT COUNT(*) FROM assets_fts").fetchone()[0]
             assert fts_count_after == len(assets) + 1
@@ -161,7 +204,6 @@ class TestDatabaseIntegration:
                 "UPDATE assets SET file_name = ? WHERE asset_id = ?",
                 ("updated_fts_test.txt", test_asset_id)
             )
-            conn.commit()
             
             # Verify FTS was updated
             fts_updated = conn.execute(
@@ -173,17 +215,14 @@ class TestDatabaseIntegration:
             
             # Delete asset
             conn.execute("DELETE FROM assets WHERE asset_id = ?", (test_asset_id,))
-            conn.commit()
             
             # Verify FTS entry was deleted
             fts_count_final = conn.execute("SELECT COUNT(*) FROM assets_fts").fetchone()[0]
             assert fts_count_final == len(assets)
     
-    def test_transaction_consistency(self, sample_archive):
+    def test_transaction_consistency(self, indexing):
         """Test database transaction consistency"""
         
-        indexing = IndexingService(sample_archive)
-        
         with indexing._get_connection() as conn:
             try:
                 # Start transaction
@@ -240,10 +279,11 @@ class TestDatabaseIntegration:
             assert asset_count_after == 0
             assert metadata_count_after == 0
     
-    def test_concurrent_access(self, sample_archive):
+    def test_concurrent_access(self, sample_archive, indexing):
         """Test concurrent database access"""
         
-        indexing1 = IndexingService(sample_archive)
+        # Two services on the real WAL-mode index file
+        indexing1 = indexing
         indexing2 = IndexingService(sample_archive)
         
         # Both services should be able to read concurrently
@@ -257,6 +297,13 @@ class TestDatabaseIntegration:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (test_asset_id, "/concurrent/test", "concurrent_test.txt", "concurrent_test.txt", 100, "2024-01-01", "2024-01-01", "2024-01-01"))
             
+            # Under WAL the reader neither blocks nor sees the open write
+            assert conn2.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn2.execute(
+                "SELECT COUNT(*) FROM assets WHERE asset_id = ?",
+                (test_asset_id,)
+            ).fetchone()[0] == 0
+            
             conn1.commit()
             
             # Read with second connection
@@ -268,48 +315,41 @@ class TestDatabaseIntegration:
             assert result is not None
             assert result[0] == test_asset_id
     
-    def test_data_integrity_constraints(self, sample_archive):
+    def test_data_integrity_constraints(self, conn):
         """Test database constraints and data integrity"""
         
-        indexing = IndexingService(sample_archive)
+        # Test unique constraint on asset_id (should be PRIMARY KEY)
+        test_asset_id = "integrity-test-asset"
         
-        with indexing._get_connection() as conn:
-            # Test unique constraint on asset_id (should be PRIMARY KEY)
-            test_asset_id = "integrity-test-asset"
-            
-            # Insert first asset
+        # Insert first asset
+        conn.execute("""
+            INSERT INTO assets (
+                asset_id, original_path, archive_path, file_name, file_size,
+                created_at, updated_at, indexed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (test_asset_id, "/integrity/test1", "test1.txt", "test1.txt", 100, "2024-01-01", "2024-01-01", "2024-01-01"))
+        
+        # Try to insert duplicate asset_id (should fail)
+        with pytest.raises(sqlite3.IntegrityError):
             conn.execute("""
                 INSERT INTO assets (
                     asset_id, original_path, archive_path, file_name, file_size,
                     created_at, updated_at, indexed_at
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (test_asset_id, "/integrity/test1", "test1.txt", "test1.txt", 100, "2024-01-01", "2024-01-01", "2024-01-01"))
-            
-            conn.commit()
-            
-            # Try to insert duplicate asset_id (should fail)
-            with pytest.raises(sqlite3.IntegrityError):
-                conn.execute("""
-                    INSERT INTO assets (
-                        asset_id, original_path, archive_path, file_name, file_size,
-                        created_at, updated_at, indexed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (test_asset_id, "/integrity/test2", "test2.txt", "test2.txt", 200, "2024-01-01", "2024-01-01", "2024-01-01"))
-            
-            # Test unique constraint on asset_metadata (asset_id, field_name) combination
+            """, (test_asset_id, "/integrity/test2", "test2.txt", "test2.txt", 200, "2024-01-01", "2024-01-01", "2024-01-01"))
+        
+        # Test unique constraint on asset_metadata (asset_id, field_name) combination
+        conn.execute("""
+            INSERT INTO asset_metadata (asset_id, field_name, field_value, field_type)
+            VALUES (?, ?, ?, ?)
+        """, (test_asset_id, "title", "First Title", "str"))
+        
+        # Try to insert duplicate field for same asset (should fail due to UNIQUE constraint)
+        with pytest.raises(sqlite3.IntegrityError):
             conn.execute("""
                 INSERT INTO asset_metadata (asset_id, field_name, field_value, field_type)
                 VALUES (?, ?, ?, ?)
-            """, (test_asset_id, "title", "First Title", "str"))
-            
-            conn.commit()
-            
-            # Try to insert duplicate field for same asset (should fail due to UNIQUE constraint)
-            with pytest.raises(sqlite3.IntegrityError):
-                conn.execute("""
-                    INSERT INTO asset_metadata (asset_id, field_name, field_value, field_type)
-                    VALUES (?, ?, ?, ?)
-                """, (test_asset_id, "title", "Second Title", "str"))
+            """, (test_asset_id, "title", "Second Title", "str"))
     
     def test_database_recovery_from_corruption(self, sample_archive, temp_dir):
         """Test database can be rebuilt if corrupted"""
@@ -370,10 +410,25 @@ class TestDatabaseIntegration:
         
         # Get all results from search
         search_results, search_total = search.search()
+        asset_ids = [result.asset_id for result in search_results]
+        placeholders = ",".join("?" * len(asset_ids))
         
-        # Get count from database directly
+        # Read the counts, rows and metadata back over one connection
         with indexing._get_connection() as conn:
             db_count = conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+            
+            db_rows = {
+                row['asset_id']: row for row in conn.execute(
+                    f"SELECT * FROM assets WHERE asset_id IN ({placeholders})", asset_ids
+                )
+            }
+            
+            db_metadata_by_asset = {}
+            for row in conn.execute(
+                "SELECT asset_id, field_name, field_value FROM asset_metadata "
+                f"WHERE asset_id IN ({placeholders})", asset_ids
+            ):
+                db_metadata_by_asset.setdefault(row['asset_id'], {})[row['field_name']] = row['field_value']
         
         # Counts should match
         assert search_total == db_count
@@ -381,34 +436,25 @@ class TestDatabaseIntegration:
         
         # Verify each search result corresponds to actual database entry
         for result in search_results:
-            with indexing._get_connection() as conn:
-                db_row = conn.execute(
-                    "SELECT * FROM assets WHERE asset_id = ?",
-                    (result.asset_id,)
-                ).fetchone()
-                
-                assert db_row is not None
-                assert db_row['asset_id'] == result.asset_id
-                assert db_row['archive_path'] == result.archive_path
-                assert db_row['file_size'] == result.file_size
-                
-                # Verify custom metadata matches
-                metadata_rows = conn.execute(
-                    "SELECT field_name, field_value FROM asset_metadata WHERE asset_id = ?",
-                    (result.asset_id,)
-                ).fetchall()
-                
-                db_metadata = {row['field_name']: row['field_value'] for row in metadata_rows}
-                
-                # Convert search result metadata for comparison
-                search_metadata = {}
-                for key, value in result.custom_metadata.items():
-                    if isinstance(value, list):
-                        search_metadata[key] = str(value)  # Lists stored as JSON strings
-                    else:
-                        search_metadata[key] = str(value)
-                
-                # All database metadata should be in search results
-                for field_name, field_value in db_metadata.items():
-                    assert field_name in search_metadata
-                    # Note: exact comparison may vary due to type conversion
\ No newline at end of file
+            db_row = db_rows.get(result.asset_id)
+            
+            assert db_row is not None
+            assert db_row['asset_id'] == result.asset_id
+            assert db_row['archive_path'] == result.archive_path
+            assert db_row['file_size'] == result.file_size
+            
+            # Verify custom metadata matches
+            db_metadata = db_metadata_by_asset.get(result.asset_id, {})
+            
+            # Convert search result metadata for comparison
+            search_metadata = {}
+            for key, value in result.custom_metadata.items():
+                if isinstance(value, list):
+                    search_metadata[key] = str(value)  # Lists stored as JSON strings
+                else:
+                    search_metadata[key] = str(value)
+            
+            # All database metadata should be in search results
+            for field_name, field_value in db_metadata.items():
+                assert field_name in search_metadata
+                # Note: exact comparison may vary due to type conversion
\ No newline at end of file
@@ -4,6 +4,7 @@ Integration tests for complete Archive Tool workflows
 
 import pytest
 import json
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -15,118 +16,155 @@ from src.core import (
 )
 
 
+def _count_asset_files(root):
+    """Count files under root that are not metadata sidecars.
+
+    Walks with os.scandir so file/dir checks reuse the readdir entry type
+    instead of stat-ing every path.
+    """
+    count = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif not entry.name.endswith('.metadata.json'):
+                    count += 1
+    return count
+
+
+@pytest.fixture(scope="module")
+def prebuilt_archive(tmp_path_factory, sample_files):
+    """Archive with sample_files ingested and indexed, built once per module.
+
+    Tests copy it with the workflow_archive fixture instead of repeating
+    the create → profile → ingest steps; treat it as read-only.
+    """
+    # Step 1: Create archive
+    archive_path = tmp_path_factory.mktemp("prebuilt") / "workflow_archive"
+    archive = Archive(archive_path)
+    archive.create("Workflow Test Archive", "Integration test archive")
+    
+    # Step 2: Create and save profile
+    now = datetime.now().isoformat()
+    profile = Profile(
+        id="workflow_profile",
+        name="Workflow Profile",
+        description="Test profile for workflow",
+        created_at=now,
+        updated_at=now
+    )
+    
+    profile.add_field(MetadataField(
+        name="title",
+        display_name="Title",
+        field_type=FieldType.TEXT,
+        required=True
+    ))
+    
+    profile.add_field(MetadataField(
+        name="category",
+        display_name="Category",
+        field_type=FieldType.SELECT,
+        options=["Document", "Image", "Data"]
+    ))
+    
+    profile.add_field(MetadataField(
+        name="tags",
+        display_name="Tags",
+        field_type=FieldType.TAGS
+    ))
+    
+    # Save profile
+    profile_path = archive.profiles_path / f"{profile.id}.json"
+    profile.save_to_file(profile_path)
+    
+    # Step 3: Ingest files
+    ingestion = FileIngestionService(archive)
+    indexing = IndexingService(archive)
+    
+    all_metadata = [
+        {
+            "title": f"Workflow File {i+1}",
+            "category": "Document" if file_path.suffix == ".txt" else "Data",
+            "tags": ["workflow", "test", f"file_{i+1}"]
+        }
+        for i, file_path in enumerate(sample_files)
+    ]
+    ingested_assets = ingestion.ingest_files(sample_files, profile=profile, custom_metadata_list=all_metadata)
+    
+    # Index assets in one transaction
+    success = indexing.index_assets_batch(ingested_assets)
+    assert success is True
+    
+    return archive_path
+
+
+@pytest.fixture
+def workflow_archive(temp_dir, prebuilt_archive):
+    """Private copy of the prebuilt workflow archive"""
+    archive_path = temp_dir / "workflow_archive"
+    shutil.copytree(prebuilt_archive, archive_path)
+    return Archive(archive_path).load()
+
+
 @pytest.mark.integration
 class TestCompleteArchiveWorkflow:
     """Test complete archive workflow from creation to export"""
     
-    def test_create_archive_to_export_workflow(self, temp_dir, sample_files):
-        """Test complete workflow: create → profile → ingest → search → verify → export"""
-        
-        # Step 1: Create archive
-        archive_path = temp_dir / "workflow_archive"
-        archive = Archive(archive_path)
-        archive.create("Workflow Test Archive", "Integration test archive")
+    # The create → profile → ingest stages are done once by prebuilt_archive;
+    # each later stage is its own test on a private copy of that archive.
+    
+    def test_stage_create(self, workflow_archive):
+        """Archive and workflow profile exist after the create stage"""
+        archive = workflow_archive
         
         assert archive.exists()
         assert archive.config.name == "Workflow Test Archive"
+        assert (archive.profiles_path / "workflow_profile.json").exists()
+    
+    def test_stage_ingest(self, sample_files, workflow_archive):
+        """All files were ingested and indexed"""
+        stats = IndexingService(workflow_archive).get_statistics()
         
-        # Step 2: Create and save profile
-        profile = Profile(
-            id="workflow_profile",
-            name="Workflow Profile",
-            description="Test profile for workflow",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
-        )
-        
-        profile.add_field(MetadataField(
-            name="title",
-            display_name="Title",
-            field_type=FieldType.TEXT,
-            required=True
-        ))
-        
-        profile.add_field(MetadataField(
-            name="category",
-            display_name="Category",
-            field_type=FieldType.SELECT,
-            options=["Document", "Image", "Data"]
-        ))
-        
-        profile.add_field(MetadataField(
-            name="tags",
-            display_name="Tags",
-            field_type=FieldType.TAGS
-        ))
-        
-        # Save profile
-        profile_path = archive.profiles_path / f"{profile.id}.json"
-        profile.save_to_file(profile_path)
-        
-        # Step 3: Ingest files
-        ingestion = FileIngestionService(archive)
-        indexing = IndexingService(archive)
-        
-        ingested_assets = []
-        for i, file_path in enumerate(sample_files):
-            custom_metadata = {
-                "title": f"Workflow File {i+1}",
-                "category": "Document" if file_path.suffix == ".txt" else "Data",
-                "tags": ["workflow", "test", f"file_{i+1}"]
-            }
-            
-            asset = ingestion.ingest_file(
-                file_path,
-                profile=profile,
-                custom_metadata=custom_metadata
-            )
-            
-            # Index asset
-            success = indexing.index_asset(asset)
-            assert success is True
-            
-            ingested_assets.append(asset)
-        
-        # Step 4: Verify all files were ingested and indexed
-        stats = indexing.get_statistics()
         assert stats['total_assets'] == len(sample_files)
         assert stats['total_size'] > 0
+    
+    @pytest.mark.parametrize("search_kwargs, matches_all", [
+        ({}, True),
+        ({"query": "workflow"}, False),  # "workflow" is in every title
+        ({"filters": {"category": "Document"}}, False),
+        ({"filters": {"tags": "test"}}, True),  # All files have "test" tag
+    ])
+    def test_stage_search(self, sample_files, workflow_archive, search_kwargs, matches_all):
+        """Search by everything, text query, select field and tags"""
+        results, total = SearchService(workflow_archive).search(**search_kwargs)
+        
+        if matches_all:
+            assert total == len(sample_files)
+            assert len(results) == len(sample_files)
+        else:
+            assert total > 0
         
-        # Step 5: Test search functionality
-        search = SearchService(archive)
-        
-        # Search all assets
-        all_results, total = search.search()
-        assert total == len(sample_files)
-        assert len(all_results) == len(sample_files)
-        
-        # Search by text query
-        text_results, text_total = search.search(query="workflow")
-        assert text_total > 0  # Should find files with "workflow" in metadata
-        
-        # Search by category filter
-        doc_results, doc_total = search.search(filters={"category": "Document"})
-        assert doc_total > 0
-        
-        for result in doc_results:
-            assert result.custom_metadata["category"] == "Document"
-        
-        # Search by tags
-        tag_results, tag_total = search.search(filters={"tags": "test"})
-        assert tag_total == len(sample_files)  # All files have "test" tag
-        
-        # Step 6: Verify integrity
-        integrity = IntegrityService(archive)
-        report = integrity.verify_all()
+        for result in results:
+            for field, value in search_kwargs.get("filters", {}).items():
+                stored = result.custom_metadata[field]
+                assert stored == value or value in stored
+    
+    def test_stage_verify(self, sample_files, workflow_archive):
+        """Integrity verification passes for every ingested file"""
+        report = IntegrityService(workflow_archive).verify_all()
         
         assert report.total_assets == len(sample_files)
         assert report.verified_assets == len(sample_files)
         assert report.success_rate == 100.0
         assert len(report.corrupted_assets) == 0
         assert len(report.missing_assets) == 0
-        
-        # Step 7: Export to BagIt
-        export_service = ExportService(archive)
+    
+    def test_stage_export(self, temp_dir, sample_files, workflow_archive):
+        """Export to BagIt carries every asset file"""
+        export_service = ExportService(workflow_archive)
         bagit_path = temp_dir / "workflow_export.bag"
         
         metadata = {
@@ -144,11 +182,11 @@ class TestCompleteArchiveWorkflow:
         
         # Verify exported files exist
         data_dir = result_path / "data"
-        exported_files = list(data_dir.rglob("*"))
-        asset_files = [f for f in exported_files if f.is_file() and not f.name.endswith('.metadata.json')]
-        assert len(asset_files) == len(sample_files)
-        
-        # Step 8: Generate manifest
+        assert _count_asset_files(data_dir) == len(sample_files)
+    
+    def test_stage_manifest(self, temp_dir, sample_files, workflow_archive):
+        """JSON manifest lists every asset with its metadata"""
+        export_service = ExportService(workflow_archive)
         manifest_path = temp_dir / "workflow_manifest.json"
         export_service.generate_manifest(manifest_path, format="json")
         
@@ -176,12 +214,13 @@ class TestCompleteArchiveWorkflow:
         archive.create("Multi-Profile Archive", "Test archive with multiple profiles")
         
         # Create document profile
+        now = datetime.now().isoformat()
         doc_profile = Profile(
             id="documents",
             name="Documents",
             description="Profile for documents",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
+            created_at=now,
+            updated_at=now
         )
         
         doc_profile.add_field(MetadataField(
@@ -209,8 +248,8 @@ class TestCompleteArchiveWorkflow:
             id="media",
             name="Media Files",
             description="Profile for media files",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
+            created_at=now,
+            updated_at=now
         )
         
         media_profile.add_field(MetadataField(
@@ -242,34 +281,32 @@ class TestCompleteArchiveWorkflow:
         indexing = IndexingService(archive)
         
         # Text files use document profile
-        doc_assets = []
         text_files = [f for f in sample_files if f.suffix == ".txt"]
         
-        for i, file_path in enumerate(text_files):
-            metadata = {
+        doc_metadata = [
+            {
                 "title": f"Document {i+1}",
                 "author": f"Author {i+1}",
                 "document_type": "Report"
             }
-            
-            asset = ingestion.ingest_file(file_path, profile=doc_profile, custom_metadata=metadata)
-            indexing.index_asset(asset)
-            doc_assets.append(asset)
+            for i in range(len(text_files))
+        ]
+        doc_assets = ingestion.ingest_files(text_files, profile=doc_profile, custom_metadata_list=doc_metadata)
         
         # Non-text files use media profile
-        media_assets = []
         non_text_files = [f for f in sample_files if f.suffix != ".txt"]
         
-        for i, file_path in enumerate(non_text_files):
-            metadata = {
+        media_metadata = [
+            {
                 "title": f"Media File {i+1}",
                 "format": "Image" if file_path.suffix == ".jpg" else "Data",
                 "resolution": "1920x1080"
             }
-            
-            asset = ingestion.ingest_file(file_path, profile=media_profile, custom_metadata=metadata)
-            indexing.index_asset(asset)
-            media_assets.append(asset)
+            for i, file_path in enumerate(non_text_files)
+        ]
+        media_assets = ingestion.ingest_files(non_text_files, profile=media_profile, custom_metadata_list=media_metadata)
+        
+        assert indexing.index_assets_batch(doc_assets + media_assets)
         
         # Test profile-specific searches
         search = SearchService(archive)
@@ -308,12 +345,13 @@ class TestCompleteArchiveWorkflow:
         archive.create("Large File Archive", "Test archive with larger files")
         
         # Create profile
+        now = datetime.now().isoformat()
         profile = Profile(
             id="large_files",
             name="Large Files",
             description="Profile for large files",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
+            created_at=now,
+            updated_at=now
         )
         
         profile.add_field(MetadataField(
@@ -330,9 +368,8 @@ class TestCompleteArchiveWorkflow:
         for i in range(3):
             file_path = temp_dir / f"large_file_{i}.txt"
             
-            # Create ~1MB file
-            content = f"Large file {i} content\n" * 50000
-            file_path.write_text(content)
+            # Create ~1MB file from pre-encoded bytes (one write, no transcode)
+            file_path.write_bytes(f"Large file {i} content\n".encode("ascii") * 50000)
             large_files.append(file_path)
         
         # Ingest and verify
@@ -345,13 +382,9 @@ class TestCompleteArchiveWorkflow:
         
         ingestion.set_progress_callback(progress_callback)
         
-        assets = []
-        for i, file_path in enumerate(large_files):
-            metadata = {"title": f"Large File {i+1}"}
-            
-            asset = ingestion.ingest_file(file_path, profile=profile, custom_metadata=metadata)
-            indexing.index_asset(asset)
-            assets.append(asset)
+        large_metadata = [{"title": f"Large File {i+1}"} for i in range(len(large_files))]
+        assets = ingestion.ingest_files(large_files, profile=profile, custom_metadata_list=large_metadata)
+        assert indexing.index_assets_batch(assets)
         
         # Verify all files processed
         assert len(assets) == len(large_files)
@@ -382,69 +415,44 @@ class TestCompleteArchiveWorkflow:
         for result in results:
             assert result.file_size > 1000000  # Should be ~1MB
     
-    def test_error_recovery_workflow(self, temp_dir, sample_files):
+    def test_error_recovery_workflow(self, sample_files, workflow_archive):
         """Test workflow behavior when encountering errors and recovery"""
         
-        # Create archive
-        archive_path = temp_dir / "error_recovery_archive"
-        archive = Archive(archive_path)
-        archive.create("Error Recovery Archive", "Test archive for error recovery")
-        
-        # Create profile
-        profile = Profile(
-            id="recovery_profile",
-            name="Recovery Profile",
-            description="Profile for error recovery tests",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
-        )
-        
-        profile.add_field(MetadataField(
-            name="title",
-            display_name="Title",
-            field_type=FieldType.TEXT,
-            required=True
-        ))
-        
-        profile.save_to_file(archive.profiles_path / f"{profile.id}.json")
-        
-        # Step 1: Normal ingestion
-        ingestion = FileIngestionService(archive)
-        indexing = IndexingService(archive)
+        # Step 1: Start from the prebuilt archive; one set of services
+        # serves every step below
+        archive = workflow_archive
+        integrity = IntegrityService(archive)
+        search = integrity.search_service
         
-        assets = []
-        for i, file_path in enumerate(sample_files[:2]):  # Only first 2 files
-            metadata = {"title": f"Recovery File {i+1}"}
-            
-            asset = ingestion.ingest_file(file_path, profile=profile, custom_metadata=metadata)
-            indexing.index_asset(asset)
-            assets.append(asset)
+        all_results, _ = search.search()
+        text_result = next(r for r in all_results if r.archive_path.endswith(".txt"))
         
         # Step 2: Simulate corruption by modifying a file
-        first_asset = assets[0]
-        corrupted_file_path = archive.root_path / first_asset.metadata.archive_path
+        corrupted_file_path = archive.root_path / text_result.archive_path
         
-        # Modify the file content to corrupt it
-        original_content = corrupted_file_path.read_text()
-        corrupted_file_path.write_text(original_content + "\nCORRUPTED DATA")
+        # Append to the file to corrupt it, remembering where it ended
+        original_size = corrupted_file_path.stat().st_size
+        with open(corrupted_file_path, 'ab') as f:
+            f.write(b"\nCORRUPTED DATA")
         
         # Step 3: Test integrity verification detects corruption  
-        integrity = IntegrityService(archive)
         report = integrity.verify_all()
         
-        assert report.total_assets == 2
-        assert report.verified_assets == 1  # One should fail
+        total_assets = len(sample_files)
+        
+        assert report.total_assets == total_assets
+        assert report.verified_assets == total_assets - 1  # One should fail
         assert len(report.corrupted_assets) == 1
-        assert report.success_rate == 50.0
+        assert report.success_rate == pytest.approx((total_assets - 1) / total_assets * 100)
         
         # Step 4: Restore file and verify recovery
-        corrupted_file_path.write_text(original_content)
+        os.truncate(corrupted_file_path, original_size)
         
         # Re-verify
         recovery_report = integrity.verify_all()
         
-        assert recovery_report.total_assets == 2
-        assert recovery_report.verified_assets == 2
+        assert recovery_report.total_assets == total_assets
+        assert recovery_report.verified_assets == total_assets
         assert len(recovery_report.corrupted_assets) == 0
         assert recovery_report.success_rate == 100.0
         
@@ -452,7 +460,7 @@ class TestCompleteArchiveWorkflow:
         # Manually add a file without proper ingestion
         orphan_file = archive.assets_path / "orphan.txt"
         orphan_file.parent.mkdir(parents=True, exist_ok=True)
-        orphan_file.write_text("Orphaned file content")
+        orphan_file.write_bytes(b"Orphaned file content")
         
         # Find orphaned files
         orphaned = integrity.find_orphaned_files()
@@ -466,7 +474,6 @@ class TestCompleteArchiveWorkflow:
         assert repair_stats['errors'] == 0
         
         # Verify orphan is now searchable
-        search = SearchService(archive)
         results, total = search.search()
         
-        assert total == 3  # Original 2 + orphaned file
\ No newline at end of file
+        assert total == total_assets + 1  # Originals + orphaned file
\ No newline at end of file
@@ -6,6 +6,8 @@ import pytest
 import time
 import psutil
 import os
+import statistics
+import tracemalloc
 from pathlib import Path
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
@@ -17,70 +19,135 @@ from src.core import (
 )
 
 
+def _populate_large_archive(archive, profile, num_files):
+    """Populate archive with ~50 KB test files, ingested and indexed"""
+    
+    print(f"Populating archive with {num_files} files for performance testing...")
+    
+    ingestion = FileIngestionService(archive)
+    indexing = IndexingService(archive)
+    
+    metadatas = [
+        {"title": f"Performance File {i+1}", "category": f"Type{i % 3 + 1}"}
+        for i in range(num_files)
+    ]
+    
+    for i in range(num_files):
+        if i % 50 == 0:
+            print(f"  Progress: {i}/{num_files}")
+        
+        # Create temporary file (larger files for meaningful I/O operations)
+        temp_file = archive.root_path / f"temp_populate_{i}.txt"
+        # Create larger files (about 50KB each) to make checksum verification meaningful
+        line = b"Content line %d with some data to make the file larger for performance testing\n" % i
+        temp_file.write_bytes(b"Performance test file %d\n" % i + line * 500)
+        
+        try:
+            asset = ingestion.ingest_file(temp_file, profile=profile, custom_metadata=metadatas[i])
+            indexing.index_asset(asset)
+        finally:
+            # Clean up temp file
+            if temp_file.exists():
+                temp_file.unlink()
+    
+    print(f"Populated archive with {num_files} files")
+
+
+def _traced_search_memory(search, limit, runs=10):
+    """Run search(limit=limit) several times under tracemalloc.
+    
+    Returns (result count, bytes still traced afterwards, peak traced bytes).
+    """
+    tracemalloc.start()
+    try:
+        for _ in range(runs):
+            results, total = search.search(limit=limit)
+        
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return len(results), retained, peak
+
+
+@pytest.fixture(scope="class")
+def populated_performance_archive(performance_archive_factory):
+    """Archive of its own with 1000 assets, populated once per class"""
+    with performance_archive_factory() as (archive, profile):
+        _populate_large_archive(archive, profile, 1000)
+        yield archive, profile
+
+
 @pytest.mark.performance
 @pytest.mark.slow
 class TestLargeArchivePerformance:
     """Test performance with large numbers of files"""
     
-    def test_ingest_1000_files_performance(self, performance_archive, tmp_path):
+    def test_ingest_1000_files_performance(self, performance_archive, temp_dir):
         """Test ingesting 1000 files and measure performance"""
         
         archive, profile = performance_archive
         
         # Create 1000 test files
-        files_dir = tmp_path / "perf_files"
+        files_dir = temp_dir / "perf_files"
         files_dir.mkdir()
         
         test_files = []
         
         print(f"\nCreating 1000 test files...")
-        start_create = time.time()
+        start_create = time.perf_counter()
         
+        body = b"Content line\n" * 10
         for i in range(1000):
             file_path = files_dir / f"perf_file_{i:04d}.txt"
-            content = f"Performance test file {i}\n" + "Content line\n" * 10
-            file_path.write_text(content)
+            file_path.write_bytes(b"Performance test file %d\n" % i + body)
             test_files.append(file_path)
         
-        create_time = time.time() - start_create
+        create_time = time.perf_counter() - start_create
         print(f"Created 1000 files in {create_time:.2f} seconds")
         
         # Measure ingestion performance
         ingestion = FileIngestionService(archive)
         indexing = IndexingService(archive)
+        # Other tests share this archive, so count only what this test adds
+        assets_before = indexing.get_statistics()['total_assets']
         
-        ingestion_times = []
-        indexing_times = []
-        
-        print(f"Ingesting and indexing 1000 files...")
-        overall_start = time.time()
+        total_ingestion_time = 0.0
+        total_indexing_time = 0.0
         
-        for i, file_path in enumerate(test_files):
-            if i % 100 == 0:
-                print(f"  Progress: {i}/1000 files")
-            
-            metadata = {
+        metadatas = [
+            {
                 "title": f"Performance File {i+1}",
                 "category": f"Type{i % 3 + 1}",  # Rotate between 3 types
             }
+            for i in range(len(test_files))
+        ]
+        
+        print(f"Ingesting and indexing 1000 files...")
+        overall_start = time.perf_counter()
+        
+        # Ingest and index in batches: one index transaction per batch
+        batch_size = 128
+        for batch_start in range(0, len(test_files), batch_size):
+            print(f"  Progress: {batch_start}/1000 files")
+            batch_files = test_files[batch_start:batch_start + batch_size]
+            
+            metadata_list = metadatas[batch_start:batch_start + batch_size]
             
             # Measure ingestion time
-            ingest_start = time.time()
-            asset = ingestion.ingest_file(file_path, profile=profile, custom_metadata=metadata)
-            ingest_time = time.time() - ingest_start
-            ingestion_times.append(ingest_time)
+            ingest_start = time.perf_counter()
+            assets = ingestion.ingest_files(batch_files, profile=profile, custom_metadata_list=metadata_list)
+            total_ingestion_time += time.perf_counter() - ingest_start
             
             # Measure indexing time
-            index_start = time.time()
-            indexing.index_asset(asset)
-            index_time = time.time() - index_start
-            indexing_times.append(index_time)
+            index_start = time.perf_counter()
+            assert indexing.index_assets_batch(assets)
+            total_indexing_time += time.perf_counter() - index_start
         
-        overall_time = time.time() - overall_start
+        overall_time = time.perf_counter() - overall_start
         
         # Performance assertions and reporting
-        avg_ingestion_time = sum(ingestion_times) / len(ingestion_times)
-        avg_indexing_time = sum(indexing_times) / len(indexing_times)
+        avg_ingestion_time = total_ingestion_time / len(test_files)
+        avg_indexing_time = total_indexing_time / len(test_files)
         
         print(f"\nPerformance Results for 1000 files:")
         print(f"  Total time: {overall_time:.2f} seconds")
@@ -95,71 +162,55 @@ class TestLargeArchivePerformance:
         
         # Verify all files were processed
         stats = indexing.get_statistics()
-        assert stats['total_assets'] == 1000
+        assert stats['total_assets'] == assets_before + 1000
     
-    def test_search_performance_large_archive(self, performance_archive, benchmark):
+    def test_search_performance_large_archive(self, populated_performance_archive, benchmark):
         """Test search performance with large number of indexed assets"""
         
-        archive, profile = performance_archive
-        
-        # Pre-populate archive with test data
-        if not hasattr(self, '_populated_large_archive'):
-            self._populate_large_archive(archive, profile, 500)  # 500 files for search test
-            self._populated_large_archive = True
+        archive, profile = populated_performance_archive
         
         search = SearchService(archive)
         
-        # Benchmark different search operations
-        def search_all():
-            results, total = search.search(limit=100)
-            return results, total
-        
-        def search_by_text():
-            results, total = search.search(query="Performance", limit=50)
-            return results, total
+        # Benchmark the four search operations as one batch on one connection
+        searches = [
+            {"limit": 100},  # Search all
+            {"query": "Performance", "limit": 50},  # Text search
+            {"filters": {"category": "Type1"}, "limit": 50},  # Filter search
+            {  # Multiple filters
+                "filters": {"category": "Type1", "title": "Performance File 100"},
+                "limit": 10
+            },
+        ]
         
-        def search_by_filter():
-            results, total = search.search(filters={"category": "Type1"}, limit=50)
-            return results, total
-        
-        def search_by_multiple_filters():
-            results, total = search.search(
-                filters={"category": "Type1", "title": "Performance File 100"},
-                limit=10
-            )
-            return results, total
-        
-        # Benchmark search operations
         print(f"\nBenchmarking search operations:")
         
+        all_results, text_results, filter_results, multi_results = benchmark(
+            search.search_many, searches
+        )
+        
         # Search all assets
-        results, total = benchmark(search_all)
+        results, total = all_results
         print(f"  Search all: found {total} assets")
         assert total > 0
         
         # Text search
-        results, total = benchmark(search_by_text)
+        results, total = text_results
         print(f"  Text search: found {total} assets")
         assert total > 0
         
         # Filter search
-        results, total = benchmark(search_by_filter)
+        results, total = filter_results
         print(f"  Filter search: found {total} assets")
         assert total > 0
         
         # Multiple filters
-        results, total = benchmark(search_by_multiple_filters)
+        results, total = multi_results
         print(f"  Multiple filters: found {total} assets")
     
-    def test_integrity_verification_performance(self, performance_archive):
+    def test_integrity_verification_performance(self, populated_performance_archive):
         """Test performance of integrity verification on large archive"""
         
-        archive, profile = performance_archive
-        
-        # Pre-populate if needed
-        if not hasattr(self, '_populated_integrity_archive'):
-            self._populate_large_archive(archive, profile, 1000)  # 1000 files for integrity test  
-            self._populated_integrity_archive = True
+        archive, profile = populated_performance_archive
         
         integrity = IntegrityService(archive)
         
@@ -171,9 +222,9 @@ class TestLargeArchivePerformance:
         print(f"Memory before: {memory_before:.1f} MB")
         
         # Test single-threaded verification
-        start_time = time.time()
+        start_time = time.perf_counter()
         report_single = integrity.verify_all(max_workers=1)
-        single_time = time.time() - start_time
+        single_time = time.perf_counter() - start_time
         
         memory_during = process.memory_info().rss / 1024 / 1024  # MB
         
@@ -184,9 +235,9 @@ class TestLargeArchivePerformance:
         print(f"  Success rate: {report_single.success_rate:.1f}%")
         
         # Test multi-threaded verification
-        start_time = time.time()
+        start_time = time.perf_counter()
         report_multi = integrity.verify_all(max_workers=4)
-        multi_time = time.time() - start_time
+        multi_time = time.perf_counter() - start_time
         
         memory_after = process.memory_info().rss / 1024 / 1024  # MB
         
@@ -206,20 +257,20 @@ class TestLargeArchivePerformance:
         assert report_single.total_assets == report_multi.total_assets
         assert report_single.verified_assets == report_multi.verified_assets
     
-    def test_concurrent_operations_performance(self, performance_archive, tmp_path):
+    def test_concurrent_operations_performance(self, performance_archive, temp_dir):
         """Test performance of concurrent operations"""
         
         archive, profile = performance_archive
         
         # Create test files for concurrent ingestion
-        files_dir = tmp_path / "concurrent_files"
+        files_dir = temp_dir / "concurrent_files"
         files_dir.mkdir()
         
+        body = b"Line of content\n" * 20
         test_files = []
         for i in range(50):  # Smaller number for concurrent test
             file_path = files_dir / f"concurrent_file_{i:03d}.txt"
-            content = f"Concurrent test file {i}\n" + "Line of content\n" * 20
-            file_path.write_text(content)
+            file_path.write_bytes(b"Concurrent test file %d\n" % i + body)
             test_files.append(file_path)
         
         print(f"\nTesting concurrent operations with {len(test_files)} files...")
@@ -235,69 +286,65 @@ class TestLargeArchivePerformance:
                 "category": f"ConcurrentType{i % 2 + 1}",
             }
             
-            start_time = time.time()
             asset = ingestion.ingest_file(file_path, profile=profile, custom_metadata=metadata)
             indexing.index_asset(asset)
-            process_time = time.time() - start_time
             
-            return i, process_time, asset.metadata.asset_id
+            return i, asset
         
         # Sequential processing
         print("Sequential processing...")
-        sequential_start = time.time()
+        sequential_start = time.perf_counter()
         sequential_results = []
         
         for i, file_path in enumerate(test_files):
             result = ingest_and_index_file((i, file_path))
             sequential_results.append(result)
         
-        sequential_time = time.time() - sequential_start
-        
-        # Clean up for concurrent test
-        for asset_id in [r[2] for r in sequential_results]:
-            indexing.remove_asset(asset_id)
+        sequential_time = time.perf_counter() - sequential_start
         
-        # Create fresh test files for concurrent test
-        test_files_concurrent = []
-        for i in range(50):
-            file_path = files_dir / f"concurrent_file_v2_{i:03d}.txt"
-            content = f"Concurrent test file v2 {i}\n" + "Line of content\n" * 20
-            file_path.write_text(content)
-            test_files_concurrent.append(file_path)
+        # Clean up for concurrent test; the same source files are reused, so
+        # the archived copies go too or every ingest would hit duplicate renames
+        for _, asset in sequential_results:
+            indexing.remove_asset(asset.metadata.asset_id)
+            asset.file_path.unlink()
+            asset.sidecar_path.unlink(missing_ok=True)
         
         # Concurrent processing
         print("Concurrent processing...")
-        concurrent_start = time.time()
+        concurrent_start = time.perf_counter()
         
         with ThreadPoolExecutor(max_workers=4) as executor:
             concurrent_results = list(executor.map(
                 ingest_and_index_file,
-                enumerate(test_files_concurrent)
+                enumerate(test_files)
             ))
         
-        concurrent_time = time.time() - concurrent_start
+        concurrent_time = time.perf_counter() - concurrent_start
         
         print(f"\nConcurrent Operations Performance:")
         print(f"  Sequential time: {sequential_time:.2f} seconds")
         print(f"  Concurrent time: {concurrent_time:.2f} seconds")
         print(f"  Speedup: {sequential_time / concurrent_time:.2f}x")
         print(f"  Sequential rate: {len(test_files) / sequential_time:.2f} files/sec")
-        print(f"  Concurrent rate: {len(test_files_concurrent) / concurrent_time:.2f} files/sec")
+        print(f"  Concurrent rate: {len(test_files) / concurrent_time:.2f} files/sec")
         
         # Verify all files were processed correctly
         stats = indexing.get_statistics()
-        expected_total = len(test_files_concurrent)
+        expected_total = len(test_files)
         assert stats['total_assets'] >= expected_total
+        # Both passes wrote the same archive paths, without duplicate renames
+        assert sorted(asset.file_path for _, asset in concurrent_results) == \
+            sorted(asset.file_path for _, asset in sequential_results)
         
         # Performance assertions
         assert concurrent_time < sequential_time  # Concurrent should be faster
         speedup = sequential_time / concurrent_time
         assert speedup > 1.5  # Should see at least 1.5x speedup with 4 workers
     
-    def test_memory_usage_large_operations(self, performance_archive):
+    def test_memory_usage_large_operations(self, populated_performance_archive):
         """Test memory usage during large operations"""
         
-        archive, profile = performance_archive
+        archive, profile = populated_performance_archive
         
         process = psutil.Process()
         
@@ -305,37 +352,28 @@ class TestLargeArchivePerformance:
         baseline_memory = process.memory_info().rss / 1024 / 1024  # MB
         print(f"\nBaseline memory: {baseline_memory:.1f} MB")
         
-        # Pre-populate archive
-        if not hasattr(self, '_populated_memory_archive'):
-            print("Populating archive for memory test...")
-            self._populate_large_archive(archive, profile, 300)
-            self._populated_memory_archive = True
-        
         # Test search memory usage
         search = SearchService(archive)
         
-        memory_measurements = []
-        
-        # Large search operations
-        for i in range(10):
-            memory_before = process.memory_info().rss / 1024 / 1024
-            
-            # Perform large search
-            results, total = search.search(limit=1000)
-            
-            memory_after = process.memory_info().rss / 1024 / 1024
-            memory_measurements.append(memory_after - memory_before)
-        
-        avg_memory_increase = sum(memory_measurements) / len(memory_measurements)
-        max_memory_increase = max(memory_measurements)
+        # Large search operations, traced by the Python allocator, at two
+        # result counts so the comparison doesn't depend on the interpreter's
+        # per-object sizes
+        half_count, half_retained, half_peak = _traced_search_memory(search, 500)
+        full_count, full_retained, full_peak = _traced_search_memory(search, 1000)
+        assert full_count == 2 * half_count
         
         print(f"Search Memory Usage:")
-        print(f"  Average memory increase: {avg_memory_increase:.1f} MB")
-        print(f"  Maximum memory increase: {max_memory_increase:.1f} MB")
-        
-        # Memory assertions
-        assert avg_memory_increase < 50  # Average increase should be < 50MB
-        assert max_memory_increase < 100  # Max increase should be < 100MB
+        for count, retained, peak in [(half_count, half_retained, half_peak),
+                                      (full_count, full_retained, full_peak)]:
+            print(f"  {count} results: retained {retained / 1024 / 1024:.1f} MB, "
+                  f"peak {peak / 1024 / 1024:.1f} MB")
+        
+        # Memory assertions; doubling the results should roughly double the
+        # traced memory (2x), so 3x leaves room for noise but not for growth
+        # that is quadratic or that keeps earlier searches alive. tracemalloc
+        # only sees the Python heap, not sqlite's own allocations.
+        assert full_retained < 3 * half_retained
+        assert full_peak < 3 * half_peak
         
         # Test integrity verification memory usage
         integrity = IntegrityService(archive)
@@ -356,15 +394,20 @@ class TestLargeArchivePerformance:
         assert integrity_memory_increase < 200  # Should use < 200MB
         assert integrity_memory_increase / report.total_assets < 1  # < 1MB per file
     
-    def test_database_performance_scaling(self, performance_archive):
+    def test_database_performance_scaling(self, performance_archive_factory):
         """Test database performance as archive size grows"""
         
-        archive, profile = performance_archive
+        with performance_archive_factory() as (archive, profile):
+            self._measure_database_scaling(archive, profile)
+    
+    def _measure_database_scaling(self, archive, profile):
+        """Grow an empty archive to each test size and time search and indexing"""
         
         # Test at different archive sizes
         sizes_to_test = [100, 300, 500]  # Number of assets
         performance_results = {}
         
+        ingestion = FileIngestionService(archive)
         indexing = IndexingService(archive)
         search = SearchService(archive)
         
@@ -376,31 +419,34 @@ class TestLargeArchivePerformance:
                 files_to_add = target_size - current_size
                 print(f"\nAdding {files_to_add} files to reach {target_size} total assets...")
                 
-                self._add_files_to_archive(archive, profile, files_to_add, current_size)
+                self._add_files_to_archive(
+                    archive, profile, files_to_add, current_size,
+                    ingestion=ingestion, indexing=indexing
+                )
                 current_size = target_size
             
             print(f"\nTesting performance with {target_size} assets...")
             
-            # Test search performance
+            # Test search performance; one untimed warm-up run, then the
+            # median of 7 so a slow outlier doesn't skew the comparison
+            search.search(query="Performance", limit=50)
             search_times = []
-            for _ in range(5):  # 5 search tests
-                start_time = time.time()
+            for _ in range(7):
+                start_time = time.perf_counter()
                 results, total = search.search(query="Performance", limit=50)
-                search_time = time.time() - start_time
+                search_time = time.perf_counter() - start_time
                 search_times.append(search_time)
             
-            avg_search_time = sum(search_times) / len(search_times)
+            avg_search_time = statistics.median(search_times)
             
             # Test index performance (add one more file)
             temp_file = archive.root_path / f"temp_perf_test_{target_size}.txt"
-            temp_file.write_text(f"Temporary file for performance test at size {target_size}")
-            
-            ingestion = FileIngestionService(archive)
+            temp_file.write_bytes(b"Temporary file for performance test at size %d" % target_size)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             asset = ingestion.ingest_file(temp_file, profile=profile, custom_metadata={"title": "Temp File"})
             indexing.index_asset(asset)
-            index_time = time.time() - start_time
+            index_time = time.perf_counter() - start_time
             
             # Clean up temp file
             temp_file.unlink()
@@ -411,7 +457,7 @@ class TestLargeArchivePerformance:
                 'index_time': index_time
             }
             
-            print(f"  Average search time: {avg_search_time:.4f} seconds")
+            print(f"  Median search time: {avg_search_time:.4f} seconds")
             print(f"  Index time: {index_time:.4f} seconds")
         
         # Analyze scaling characteristics
@@ -434,60 +480,32 @@ class TestLargeArchivePerformance:
             # Indexing time shouldn't increase by more than 2x
             assert large_index / small_index < 2.0
     
-    def _populate_large_archive(self, archive, profile, num_files):
-        """Helper method to populate archive with test files"""
-        
-        print(f"Populating archive with {num_files} files for performance testing...")
+    def _add_files_to_archive(self, archive, profile, num_files, start_index, ingestion=None, indexing=None):
+        """Helper method to add more files to existing archive"""
         
-        ingestion = FileIngestionService(archive)
-        indexing = IndexingService(archive)
+        ingestion = ingestion or FileIngestionService(archive)
+        indexing = indexing or IndexingService(archive)
         
-        for i in range(num_files):
-            if i % 50 == 0:
-                print(f"  Progress: {i}/{num_files}")
-            
-            # Create temporary file (larger files for meaningful I/O operations)
-            temp_file = archive.root_path / f"temp_populate_{i}.txt"
-            # Create larger files (about 50KB each) to make checksum verification meaningful
-            content = f"Performance test file {i}\n" + f"Content line {i} with some data to make the file larger for performance testing\n" * 500
-            temp_file.write_text(content)
-            
-            metadata = {
-                "title": f"Performance File {i+1}",
-                "category": f"Type{i % 3 + 1}",
+        metadatas = [
+            {
+                "title": f"Added Performance File {file_index+1}",
+                "category": f"Type{file_index % 3 + 1}",
             }
-            
-            try:
-                asset = ingestion.ingest_file(temp_file, profile=profile, custom_metadata=metadata)
-                indexing.index_asset(asset)
-            finally:
-                # Clean up temp file
-                if temp_file.exists():
-                    temp_file.unlink()
-        
-        print(f"Populated archive with {num_files} files")
-    
-    def _add_files_to_archive(self, archive, profile, num_files, start_index):
-        """Helper method to add more files to existing archive"""
-        
-        ingestion = FileIngestionService(archive)
-        indexing = IndexingService(archive)
+            for file_index in range(start_index, start_index + num_files)
+        ]
         
         for i in range(num_files):
             file_index = start_index + i
             
             # Create temporary file
             temp_file = archive.root_path / f"temp_add_{file_index}.txt"
-            content = f"Added performance test file {file_index}\n" + f"Content for file {file_index}\n" * 5
-            temp_file.write_text(content)
-            
-            metadata = {
-                "title": f"Added Performance File {file_index+1}",
-                "category": f"Type{file_index % 3 + 1}",
-            }
+            temp_file.write_bytes(
+                b"Added performance test file %d\n" % file_index
+                + b"Content for file %d\n" % file_index * 5
+            )
             
             try:
-                asset = ingestion.ingest_file(temp_file, profile=profile, custom_metadata=metadata)
+                asset = ingestion.ingest_file(temp_file, profile=profile, custom_metadata=metadatas[i])
                 indexing.index_asset(asset)
             finally:
                 # Clean up temp file
@@ -524,9 +542,9 @@ class TestExportPerformance:
         process = psutil.Process()
         memory_before = process.memory_info().rss / 1024 / 1024  # MB
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         result_path = export_service.export_to_bagit(bagit_path, metadata=metadata)
-        export_time = time.time() - start_time
+        export_time = time.perf_counter() - start_time
         
         memory_after = process.memory_info().rss / 1024 / 1024  # MB
         memory_increase = memory_after - memory_before
@@ -554,17 +572,13 @@ class TestExportPerformance:
     def _add_more_assets(self, archive, num_assets):
         """Helper to add more assets to archive for testing"""
         
-        from src.core.ingestion import FileIngestionService
-        from src.core.indexing import IndexingService
-        
         ingestion = FileIngestionService(archive)
         indexing = IndexingService(archive)
         
         for i in range(num_assets):
             # Create temporary file
             temp_file = archive.root_path / f"temp_export_test_{i}.txt"
-            content = f"Export test file {i}\n" + "Test content\n" * 10
-            temp_file.write_text(content)
+            temp_file.write_bytes(b"Export test file %d\n" % i + b"Test content\n" * 10)
             
             metadata = {"title": f"Export Test File {i+1}"}
             
@@ -61,6 +61,7 @@ class TestMainWindowSimplified:
             profile_widget = MockWidgetWithSignals()
             profile_widget.set_archive = Mock()
             profile_widget.refresh = Mock()
+            profile_widget.shutdown = Mock()
             mock_profile.return_value = profile_widget
             
             integrity_widget = MockWidgetWithSignals()
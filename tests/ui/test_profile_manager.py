@@ -2,11 +2,12 @@
 Comprehensive UI tests for ProfileManager - Real user interaction testing
 """
 
+import os
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QMessageBox, QDialog
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QModelIndex
 from PyQt6.QtTest import QTest
 
 from src.ui.profile_manager import ProfileManager
@@ -27,6 +28,8 @@ class TestProfileManager:
         archive.profiles_path = temp_dir / "test_archive" / "profiles"
         archive.config = Mock()
         archive.config.name = "Test Archive"
+        # The background loader scans the archive after set_archive returns
+        archive.iter_profiles.return_value = []
         return archive
     
     @pytest.fixture
@@ -101,7 +104,7 @@ class TestProfileManager:
         assert not widget.edit_button.isEnabled()
         assert not widget.delete_button.isEnabled()
         assert not widget.profile_list.isEnabled()
-        assert widget.profile_list.count() == 0
+        assert widget.profile_model.rowCount() == 0
         assert "No archive loaded" not in widget.details_label.text()
         
         widget.close()
@@ -123,7 +126,7 @@ class TestProfileManager:
         assert widget.archive is None
         assert not widget.new_button.isEnabled()
         assert not widget.profile_list.isEnabled()
-        assert widget.profile_list.count() == 0
+        assert widget.profile_model.rowCount() == 0
         assert "No archive loaded" in widget.details_label.text()
 
     def test_profile_list_population(self, profile_manager, sample_profiles):
@@ -142,18 +145,19 @@ class TestProfileManager:
             QApplication.processEvents()
             
             # Should have loaded profiles
-            assert widget.profile_list.count() == 2
+            assert widget.profile_model.rowCount() == 2
             
             # Check profile data
-            item1 = widget.profile_list.item(0)
-            profile1 = item1.data(Qt.ItemDataRole.UserRole)
+            model = widget.profile_model
+            index1 = model.index(0)
+            profile1 = model.data(index1, Qt.ItemDataRole.UserRole)
             assert profile1.name == "Documents"
-            assert item1.text() == "Documents"
+            assert model.data(index1) == "Documents"
             
-            item2 = widget.profile_list.item(1)
-            profile2 = item2.data(Qt.ItemDataRole.UserRole)
+            index2 = model.index(1)
+            profile2 = model.data(index2, Qt.ItemDataRole.UserRole)
             assert profile2.name == "Photos"
-            assert item2.text() == "Photos"
+            assert model.data(index2) == "Photos"
 
     def test_profile_selection_and_details(self, profile_manager, sample_profiles):
         """Test profile selection and details display"""
@@ -172,7 +176,7 @@ class TestProfileManager:
             assert not widget.delete_button.isEnabled()
             
             # Select first profile
-            widget.profile_list.setCurrentRow(0)
+            widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
             QApplication.processEvents()
             
             # Should enable buttons and show details
@@ -231,10 +235,7 @@ class TestProfileManager:
             # Mock refresh after creation
             def mock_refresh():
                 # Simulate profile being added to list
-                from PyQt6.QtWidgets import QListWidgetItem
-                item = QListWidgetItem(new_profile.name)
-                item.setData(Qt.ItemDataRole.UserRole, new_profile)
-                widget.profile_list.addItem(item)
+                widget.populate_profiles([new_profile])
             
             widget.refresh_profiles = Mock(side_effect=mock_refresh)
             
@@ -255,11 +256,8 @@ class TestProfileManager:
         widget = profile_manager
         
         # Add profile to list
-        from PyQt6.QtWidgets import QListWidgetItem
-        item = QListWidgetItem(sample_profiles[0].name)
-        item.setData(Qt.ItemDataRole.UserRole, sample_profiles[0])
-        widget.profile_list.addItem(item)
-        widget.profile_list.setCurrentItem(item)
+        widget.populate_profiles([sample_profiles[0]])
+        widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
         
         with patch.object(widget.archive, 'get_profiles', return_value=[Path("profile1.json")]), \
              patch('src.models.profile.Profile.load_from_file', return_value=sample_profiles[1]), \
@@ -284,12 +282,9 @@ class TestProfileManager:
         widget = profile_manager
         
         # Add profile to list
-        from PyQt6.QtWidgets import QListWidgetItem
         original_profile = sample_profiles[0]
-        item = QListWidgetItem(original_profile.name)
-        item.setData(Qt.ItemDataRole.UserRole, original_profile)
-        widget.profile_list.addItem(item)
-        widget.profile_list.setCurrentItem(item)
+        widget.populate_profiles([original_profile])
+        widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
         
         # Create updated profile
         updated_profile = Profile(
@@ -324,20 +319,116 @@ class TestProfileManager:
                 # Should not raise exceptions for basic dialog handling
                 pass
             
-            # Test the success path by checking dialog creation  
+            # Test the success path by checking dialog creation
             mock_dialog_class.assert_called_once()
 
+    def test_existing_profiles_come_from_list(self, profile_manager, sample_profiles):
+        """Test duplicate checking reuses listed profiles instead of re-reading files"""
+        widget = profile_manager
+        widget.populate_profiles(sample_profiles)
+        widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
+
+        with patch.object(widget.archive, 'get_profiles') as mock_get_profiles, \
+             patch('src.ui.profile_manager.ProfileEditorDialog') as mock_dialog_class:
+            mock_dialog_class.return_value.exec.return_value = QDialog.DialogCode.Rejected
+
+            widget.new_profile()
+            assert mock_dialog_class.call_args[1]['existing_profiles'] == sample_profiles
+
+            widget.edit_profile()
+            assert mock_dialog_class.call_args[1]['existing_profiles'] == sample_profiles[1:]
+
+            mock_get_profiles.assert_not_called()
+
+    def test_failed_edit_save_keeps_listed_profile(self, profile_manager, sample_profiles):
+        """Test a failed save leaves the listed profile unedited and drops its cache entry"""
+        widget = profile_manager
+        widget.populate_profiles([sample_profiles[0]])
+        widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
+        
+        profile_file = widget.archive.profiles_path / f"{sample_profiles[0].id}.json"
+        widget.loader._cache[profile_file] = ((0, 0), sample_profiles[0])
+        
+        def edit_dialog(profile, existing_profiles, parent):
+            # Edits the profile it was given in place, as save_profile does
+            dialog = Mock()
+            dialog.exec.return_value = QDialog.DialogCode.Accepted
+            profile.name = "Unsaved Name"
+            dialog.get_profile.return_value = profile
+            return dialog
+        
+        with patch('src.ui.profile_manager.ProfileEditorDialog', side_effect=edit_dialog) as mock_dialog_class, \
+             patch.object(Profile, 'save_to_file', side_effect=OSError("disk full")), \
+             patch.object(QMessageBox, 'critical') as mock_critical:
+            mock_dialog_class.DialogCode = QDialog.DialogCode
+            widget.edit_profile()
+        
+        mock_critical.assert_called_once()
+        assert sample_profiles[0].name == "Documents"
+        assert widget.current_profile().name == "Documents"
+        assert profile_file not in widget.loader._cache
+    
+    def test_saved_profile_updates_list_in_place(self, profile_manager, sample_profiles):
+        """Test created and edited profiles are shown without reloading the directory"""
+        widget = profile_manager
+        widget.populate_profiles([sample_profiles[0]])
+
+        created = sample_profiles[1]
+        created.save_to_file = Mock()
+        renamed = Profile(id=sample_profiles[0].id, name="Renamed", description="")
+        renamed.save_to_file = Mock()
+
+        with patch.object(widget.archive, 'get_profiles') as mock_get_profiles, \
+             patch('src.ui.profile_manager.ProfileEditorDialog') as mock_dialog_class, \
+             patch.object(QMessageBox, 'information'):
+            mock_dialog_class.DialogCode = QDialog.DialogCode
+            mock_dialog = mock_dialog_class.return_value
+            mock_dialog.exec.return_value = QDialog.DialogCode.Accepted
+
+            mock_dialog.get_profile.return_value = created
+            widget.new_profile()
+            assert widget.profile_model.rowCount() == 2
+            assert widget.current_profile() is created
+
+            widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
+            mock_dialog.get_profile.return_value = renamed
+            widget.edit_profile()
+            assert widget.profile_model.rowCount() == 2
+            assert widget.profile_model.index(0).data() == "Renamed"
+            assert widget.current_profile() is renamed
+            assert "Renamed" in widget.details_label.text()
+
+            mock_get_profiles.assert_not_called()
+
+    def test_profile_model_row_lookup(self, profile_manager, sample_profiles):
+        """Test rows are found by profile id through set_profiles and upsert"""
+        model = profile_manager.profile_model
+        
+        model.set_profiles(sample_profiles)
+        assert model.row_of("profile1") == 0
+        assert model.row_of("profile2") == 1
+        assert model.row_of("missing") == -1
+        
+        new_profile = Profile(id="profile3", name="Audio", description="")
+        assert model.upsert(new_profile) == 2
+        assert model.row_of("profile3") == 2
+        
+        renamed = Profile(id="profile1", name="Docs", description="")
+        assert model.upsert(renamed) == 0
+        assert model.rowCount() == 3
+        assert model.profile(0).name == "Docs"
+        
+        model.clear()
+        assert model.row_of("profile1") == -1
+    
     def test_delete_profile_confirmation(self, profile_manager, sample_profiles):
         """Test delete profile shows confirmation dialog"""
         widget = profile_manager
         
         # Add profile to list
-        from PyQt6.QtWidgets import QListWidgetItem
         profile = sample_profiles[0]
-        item = QListWidgetItem(profile.name)
-        item.setData(Qt.ItemDataRole.UserRole, profile)
-        widget.profile_list.addItem(item)
-        widget.profile_list.setCurrentItem(item)
+        widget.populate_profiles([profile])
+        widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
         
         # Mock confirmation dialog to return No
         with patch.object(QMessageBox, 'question', return_value=QMessageBox.StandardButton.No):
@@ -345,19 +436,16 @@ class TestProfileManager:
             widget.delete_profile()
             
             # Should not proceed with deletion (profile still in list)
-            assert widget.profile_list.count() == 1
+            assert widget.profile_model.rowCount() == 1
 
     def test_delete_profile_success(self, profile_manager, sample_profiles):
         """Test successful profile deletion"""
         widget = profile_manager
         
         # Add profile to list
-        from PyQt6.QtWidgets import QListWidgetItem
         profile = sample_profiles[0]
-        item = QListWidgetItem(profile.name)
-        item.setData(Qt.ItemDataRole.UserRole, profile)
-        widget.profile_list.addItem(item)
-        widget.profile_list.setCurrentItem(item)
+        widget.populate_profiles([profile])
+        widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
         
         # Mock confirmation dialog to return Yes
         mock_profile_file = Mock()
@@ -392,6 +480,161 @@ class TestProfileManager:
             assert "Failed to load profiles" in str(args)
             assert "File system error" in str(args)
 
+    def test_refresh_profiles_reuses_cached_profiles(self, profile_manager, sample_profiles, temp_dir):
+        """Test unchanged profile files are not re-parsed on refresh"""
+        widget = profile_manager
+
+        profile_file = temp_dir / "profile1.json"
+        sample_profiles[0].save_to_file(profile_file)
+
+        with patch.object(widget.archive, 'get_profiles', return_value=[profile_file]), \
+             patch('src.models.profile.Profile.load_from_file', return_value=sample_profiles[0]) as mock_load:
+
+            widget.refresh_profiles()
+            widget.refresh_profiles()
+            assert mock_load.call_count == 1
+            assert widget.profile_model.rowCount() == 1
+
+            # Touching the file invalidates the cached entry
+            stat = profile_file.stat()
+            os.utime(profile_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            widget.refresh_profiles()
+            assert mock_load.call_count == 2
+
+            # So does a size change that keeps the same mtime
+            stat = profile_file.stat()
+            with open(profile_file, 'a') as f:
+                f.write("\n")
+            os.utime(profile_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            widget.refresh_profiles()
+            assert mock_load.call_count == 3
+
+        # Removed files are evicted from the cache
+        with patch.object(widget.archive, 'get_profiles', return_value=[]):
+            widget.refresh_profiles()
+        assert widget.loader._cache == {}
+
+    def test_refresh_profiles_parallel_load_keeps_order(self, profile_manager, temp_dir):
+        """Test large profile directories are parsed on a pool without reordering"""
+        widget = profile_manager
+
+        profile_files = []
+        for i in range(widget.loader.PARALLEL_THRESHOLD * 2):
+            profile_file = temp_dir / f"p{i:02d}.json"
+            Profile(id=f"p{i:02d}", name=f"Profile {i}", description="").save_to_file(profile_file)
+            profile_files.append(profile_file)
+
+        with patch.object(widget.archive, 'get_profiles', return_value=profile_files):
+            widget.refresh_profiles()
+
+        model = widget.profile_model
+        assert [model.profile(r).id for r in range(model.rowCount())] == [p.stem for p in profile_files]
+        assert len(widget.loader._cache) == len(profile_files)
+
+    def test_set_archive_loads_profiles_in_background(self, qt_app, sample_archive, sample_profiles):
+        """Test opening an archive parses profiles on the loader thread"""
+        for profile in sample_profiles:
+            profile.save_to_file(sample_archive.profiles_path / f"{profile.id}.json")
+
+        widget = ProfileManager()
+        widget.set_archive(sample_archive)
+        assert widget.loader.wait(5000)
+        qt_app.processEvents()
+
+        model = widget.profile_model
+        assert sorted(model.data(model.index(i)) for i in range(model.rowCount())) == \
+            ["Documents", "Photos"]
+
+        # A result for a superseded request is discarded
+        widget.set_archive(None)
+        widget._on_profiles_loaded(widget._load_request - 1, sample_profiles)
+        assert widget.profile_model.rowCount() == 0
+
+        widget.deleteLater()
+        qt_app.processEvents()
+
+    def test_populate_profiles_supersedes_pending_load(self, qt_app, sample_archive, sample_profiles):
+        """Test rows set directly are not overwritten by a load queued before them"""
+        sample_profiles[1].save_to_file(sample_archive.profiles_path / f"{sample_profiles[1].id}.json")
+        
+        widget = ProfileManager()
+        widget.set_archive(sample_archive)
+        widget.populate_profiles([sample_profiles[0]])
+        assert widget.loader.wait(5000)
+        qt_app.processEvents()
+        
+        model = widget.profile_model
+        assert [model.profile(r).id for r in range(model.rowCount())] == ["profile1"]
+        
+        widget.deleteLater()
+        qt_app.processEvents()
+    
+    def test_saved_profile_survives_pending_load(self, qt_app, sample_archive, sample_profiles):
+        """Test a profile saved while the list is loading is kept and stays selected"""
+        sample_profiles[0].save_to_file(sample_archive.profiles_path / f"{sample_profiles[0].id}.json")
+        
+        widget = ProfileManager()
+        widget.set_archive(sample_archive)
+        # Not on disk yet from the loader's point of view
+        widget.show_saved_profile(sample_profiles[1])
+        assert widget.loader.wait(5000)
+        qt_app.processEvents()
+        
+        model = widget.profile_model
+        assert sorted(model.profile(r).id for r in range(model.rowCount())) == ["profile1", "profile2"]
+        assert widget.current_profile().id == "profile2"
+        assert widget.edit_button.isEnabled()
+        
+        widget.deleteLater()
+        qt_app.processEvents()
+    
+    def test_loader_requests_never_block_and_close_waits(self, qt_app, mock_archive, sample_profiles):
+        """Test a busy loader queues the newest request and close() waits for it"""
+        import threading
+        
+        widget = ProfileManager()
+        assert widget.loader.parent() is widget
+        
+        release = threading.Event()
+        started = threading.Event()
+        
+        def slow_scan():
+            started.set()
+            release.wait(5)
+            return []
+        
+        mock_archive.iter_profiles.side_effect = slow_scan
+        loaded = []
+        widget.loader.profiles_loaded.connect(lambda request_id, profiles: loaded.append(request_id))
+        
+        widget.loader.request(1, mock_archive)
+        assert started.wait(5)
+        
+        # Both return at once although the thread is busy; 3 replaces 2
+        widget.loader.request(2, mock_archive)
+        widget.loader.request(3, mock_archive)
+        assert widget.loader.isRunning()
+        
+        release.set()
+        assert widget.loader.wait(5000)
+        qt_app.processEvents()
+        assert loaded == [1, 3]
+        
+        # Closing mid-load waits for the running scan and drops what's queued
+        release.clear()
+        started.clear()
+        widget.loader.request(4, mock_archive)
+        assert started.wait(5)
+        widget.loader.request(5, mock_archive)
+        threading.Timer(0.05, release.set).start()
+        widget.close()
+        assert not widget.loader.isRunning()
+        qt_app.processEvents()
+        assert loaded == [1, 3, 4]
+        
+        widget.deleteLater()
+        qt_app.processEvents()
+    
     def test_buttons_enabled_disabled_correctly(self, profile_manager, sample_profiles):
         """Test buttons are enabled/disabled correctly based on selection"""
         widget = profile_manager
@@ -402,17 +645,14 @@ class TestProfileManager:
         assert not widget.delete_button.isEnabled()
         
         # Add profile to list
-        from PyQt6.QtWidgets import QListWidgetItem
-        item = QListWidgetItem(sample_profiles[0].name)
-        item.setData(Qt.ItemDataRole.UserRole, sample_profiles[0])
-        widget.profile_list.addItem(item)
+        widget.populate_profiles([sample_profiles[0]])
         
         # Still no selection
         assert not widget.edit_button.isEnabled()
         assert not widget.delete_button.isEnabled()
         
         # Select profile
-        widget.profile_list.setCurrentItem(item)
+        widget.profile_list.setCurrentIndex(widget.profile_model.index(0))
         QApplication.processEvents()
         
         # Should enable edit/delete buttons
@@ -420,7 +660,7 @@ class TestProfileManager:
         assert widget.delete_button.isEnabled()
         
         # Clear selection by setting current item to None
-        widget.profile_list.setCurrentItem(None)
+        widget.profile_list.setCurrentIndex(QModelIndex())
         QApplication.processEvents()
         
         # Should disable edit/delete buttons
@@ -471,7 +711,7 @@ class TestProfileEditorDialog:
         assert dialog.profile is None
         assert dialog.name_edit.text() == ""
         assert dialog.description_edit.toPlainText() == ""
-        assert dialog.fields_list.count() == 0
+        assert dialog.fields_model.rowCount() == 0
         
         dialog.deleteLater()
         qt_app.processEvents()
@@ -486,7 +726,7 @@ class TestProfileEditorDialog:
         assert dialog.profile == sample_profile
         assert dialog.name_edit.text() == "Test Profile"
         assert "A test profile" in dialog.description_edit.toPlainText()
-        assert dialog.fields_list.count() == 3
+        assert dialog.fields_model.rowCount() == 3
         
         dialog.deleteLater()
         qt_app.processEvents()
@@ -497,20 +737,18 @@ class TestProfileEditorDialog:
         # Don't show dialog to avoid freezing, just test field list
         
         # Check field list items
-        assert dialog.fields_list.count() == 3
+        assert dialog.fields_model.rowCount() == 3
         
-        item1 = dialog.fields_list.item(0)
-        assert "Title (text)" in item1.text()
-        field1 = item1.data(Qt.ItemDataRole.UserRole)
+        model = dialog.fields_model
+        assert "Title (text)" in model.data(model.index(0))
+        field1 = model.data(model.index(0), Qt.ItemDataRole.UserRole)
         assert field1.name == "title"
         assert field1.required == True
         
-        item2 = dialog.fields_list.item(1)
-        assert "Tags (tags)" in item2.text()
+        assert "Tags (tags)" in model.data(model.index(1))
         
-        item3 = dialog.fields_list.item(2)
-        assert "Priority (select)" in item3.text()
-        field3 = item3.data(Qt.ItemDataRole.UserRole)
+        assert "Priority (select)" in model.data(model.index(2))
+        field3 = model.data(model.index(2), Qt.ItemDataRole.UserRole)
         assert field3.options == ["Low", "Medium", "High"]
         
         dialog.deleteLater()
@@ -537,6 +775,47 @@ class TestProfileEditorDialog:
         dialog.deleteLater()
         qt_app.processEvents()
     
+    def test_remove_field(self, qt_app, sample_profile):
+        """Test removing a field updates the list and button state once"""
+        dialog = ProfileEditorDialog(profile=sample_profile)
+        dialog.fields_list.setCurrentIndex(dialog.fields_model.index(0))
+        assert dialog.remove_field_button.isEnabled()
+
+        with patch.object(QMessageBox, 'question', return_value=QMessageBox.StandardButton.Yes):
+            dialog.remove_field()
+
+        assert dialog.fields_model.rowCount() == 2
+        assert not dialog.fields_list.selectionModel().hasSelection()
+        has_current = dialog.fields_list.currentIndex().isValid()
+        assert dialog.edit_field_button.isEnabled() == has_current
+        assert dialog.remove_field_button.isEnabled() == has_current
+
+        dialog.deleteLater()
+        qt_app.processEvents()
+
+    def test_save_field_adds_and_updates_rows(self, qt_app, sample_profile):
+        """Test saving a field appends new rows and replaces the edited row"""
+        dialog = ProfileEditorDialog()
+        model = dialog.fields_model
+
+        dialog.add_field()
+        dialog.field_editor.name_edit.setText("author")
+        dialog.field_editor.display_name_edit.setText("Author")
+        dialog.save_current_field()
+        assert model.rowCount() == 1
+        assert model.data(model.index(0)) == "Author (text)"
+
+        dialog.fields_list.setCurrentIndex(model.index(0))
+        dialog.edit_field()
+        dialog.field_editor.display_name_edit.setText("Writer")
+        dialog.save_current_field()
+        assert model.rowCount() == 1
+        assert model.data(model.index(0)) == "Writer (text)"
+        assert [f.name for f in model.fields()] == ["author"]
+
+        dialog.deleteLater()
+        qt_app.processEvents()
+
     def test_save_field_validation(self, qt_app):
         """Test field validation when saving"""
         dialog = ProfileEditorDialog()
@@ -554,7 +833,7 @@ class TestProfileEditorDialog:
             mock_warning.assert_called_once()
         
         # Should still have 0 fields (validation failed)
-        assert dialog.fields_list.count() == 0
+        assert dialog.fields_model.rowCount() == 0
         
         dialog.deleteLater()
         qt_app.processEvents()
@@ -577,8 +856,28 @@ class TestProfileEditorDialog:
         dialog.deleteLater()
         qt_app.processEvents()
 
+    def test_duplicate_profile_name_rejected(self, qt_app, sample_profile):
+        """Test saving rejects names used by other profiles but not by itself"""
+        other = Profile(id="other", name="Other Profile", description="")
+
+        dialog = ProfileEditorDialog(profile=sample_profile, existing_profiles=[sample_profile, other])
+        dialog.name_edit.setText("Other Profile")
+        with patch.object(QMessageBox, 'warning') as mock_warning:
+            dialog.save_profile()
+            mock_warning.assert_called_once()
+            assert "already exists" in str(mock_warning.call_args[0])
+
+        # Keeping its own name is not a duplicate
+        dialog.name_edit.setText("Test Profile")
+        with patch.object(QMessageBox, 'warning') as mock_warning:
+            dialog.save_profile()
+            mock_warning.assert_not_called()
+
+        dialog.deleteLater()
+        qt_app.processEvents()
+
 
-@pytest.mark.ui 
+@pytest.mark.ui
 class TestFieldEditorWidget:
     """Test FieldEditorWidget functionality"""
     
@@ -701,4 +1000,70 @@ class TestFieldEditorWidget:
         assert msg == ""
         
         widget.deleteLater()
-        qt_app.processEvents()
\ No newline at end of file
+        qt_app.processEvents()
+    
+    def test_live_validation_is_debounced(self, qt_app):
+        """Test a burst of edits triggers a single validation pass"""
+        widget = FieldEditorWidget()
+        results = []
+        widget.validation_changed.connect(lambda valid, msg: results.append((valid, msg)))
+        
+        with patch.object(widget, 'validate', wraps=widget.validate) as mock_validate:
+            QTest.keyClicks(widget.name_edit, "bad name")
+            mock_validate.assert_not_called()
+            
+            QTest.qWait(widget.VALIDATION_DELAY_MS * 3)
+            mock_validate.assert_called_once()
+        
+        assert results == [(False, "Display name is required")]
+        assert not widget.error_label.isHidden()
+        
+        # Loading a field cancels pending validation and clears the error
+        widget.load_field(MetadataField("title", "Title", FieldType.TEXT))
+        assert widget.error_label.isHidden()
+        
+        widget.deleteLater()
+        qt_app.processEvents()
+
+    def test_get_field_parses_options(self, qt_app):
+        """Test options are split per line with blanks and padding dropped"""
+        widget = FieldEditorWidget()
+        widget.name_edit.setText("priority")
+        widget.display_name_edit.setText("Priority")
+        widget.type_combo.setCurrentIndex(widget.type_combo.findData(FieldType.SELECT))
+
+        widget.options_edit.setPlainText("  Low \n\nMedium\r\n   \nHigh")
+        assert widget.get_field().options == ["Low", "Medium", "High"]
+
+        widget.options_edit.setPlainText(" \n ")
+        assert widget.get_field().options is None
+
+        widget.deleteLater()
+        qt_app.processEvents()
+    
+    def test_is_valid_name(self):
+        """Test names are letters/numbers plus any hyphens or underscores, with at least one letter or number"""
+        from src.ui.profile_editor_dialog import _is_valid_name
+        
+        for name in ["title", "field_1", "my-field", "_private", "a_-b"]:
+            assert _is_valid_name(name), name
+        
+        for name in ["", "_", "-", "__-", "bad name", "bad.name"]:
+            assert not _is_valid_name(name), name
+    
+    def test_field_validation_rejects_separator_only_names(self, qt_app):
+        """Test names need a letter or number, not just hyphens/underscores"""
+        widget = FieldEditorWidget()
+        widget.display_name_edit.setText("Test Field")
+        
+        for name in ["_", "-"]:
+            widget.name_edit.setText(name)
+            valid, msg = widget.validate()
+            assert not valid
+            assert "only letters, numbers, hyphens, and underscores" in msg
+        
+        widget.name_edit.setText("my_field-1")
+        assert widget.validate() == (True, "")
+        
+        widget.deleteLater()
+        qt_app.processEvents()
@@ -4,7 +4,7 @@ Comprehensive UI tests for SearchWidget - Real user interaction testing
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QHeaderView
 from PyQt6.QtCore import Qt
 from PyQt6.QtTest import QTest
 
@@ -114,7 +114,7 @@ class TestSearchWidget:
         # Test initial states
         assert not widget.search_input.isEnabled()
         assert not widget.search_button.isEnabled()
-        assert widget.results_table.rowCount() == 0
+        assert widget.results_model.rowCount() == 0
         
         widget.close()
         qt_app.processEvents()
@@ -204,16 +204,41 @@ class TestSearchWidget:
         QApplication.processEvents()
         
         # Verify table was populated
-        assert widget.results_table.rowCount() == len(sample_search_results)
+        assert widget.results_model.rowCount() == len(sample_search_results)
         
         # Check first row content
-        assert widget.results_table.item(0, 0).text() == "document1.txt"  # Name
-        assert "1.0 KB" in widget.results_table.item(0, 1).text()  # Size (formatted)
-        assert "text/plain" in widget.results_table.item(0, 2).text()  # Type
+        assert widget.results_model.index(0, 0).data() == "document1.txt"  # Name
+        assert "1.0 KB" in widget.results_model.index(0, 1).data()  # Size (formatted)
+        assert "text/plain" in widget.results_model.index(0, 2).data()  # Type
         
         # Check second row
-        assert widget.results_table.item(1, 0).text() == "image1.jpg"
-        assert "2.0 KB" in widget.results_table.item(1, 1).text()  # Size (formatted)
+        assert widget.results_model.index(1, 0).data() == "image1.jpg"
+        assert "2.0 KB" in widget.results_model.index(1, 1).data()  # Size (formatted)
+
+    def test_results_model_columns(self, search_widget, sample_search_results):
+        """Test the results model headers, truncated checksum and tooltip"""
+        widget, mock_service = search_widget
+        widget.populate_results(sample_search_results, len(sample_search_results), "")
+        model = widget.results_model
+
+        headers = [model.headerData(c, Qt.Orientation.Horizontal) for c in range(model.columnCount())]
+        assert headers == ["Name", "Size", "Type", "Created", "Checksum", "Path"]
+
+        assert model.index(0, 3).data() == "2024-01-01"
+        assert model.index(0, 4).data() == "abc123def456..."
+        assert model.index(0, 4).data(Qt.ItemDataRole.ToolTipRole) == "abc123def456"
+        assert model.index(0, 5).data() == "assets/2024/01/document1.txt"
+
+        user_role = Qt.ItemDataRole.UserRole
+        assert model.index(0, 0).data(user_role) is sample_search_results[0]
+        assert model.index(0, 1).data(user_role) == sample_search_results[0].file_size
+
+        header = widget.results_table.horizontalHeader()
+        assert header.sectionResizeMode(0) == QHeaderView.ResizeMode.Interactive
+        assert header.sectionResizeMode(5) == QHeaderView.ResizeMode.Stretch
+
+        widget.clear_results()
+        assert model.rowCount() == 0
 
     def test_mime_type_filter_interaction(self, search_widget, sample_search_results):
         """Test MIME type filter selection"""
@@ -282,13 +307,13 @@ class TestSearchWidget:
         QApplication.processEvents()
         
         # Verify results exist
-        assert widget.results_table.rowCount() > 0
+        assert widget.results_model.rowCount() > 0
         
         # Clear results
         widget.clear_results()
         
         # Verify results were cleared
-        assert widget.results_table.rowCount() == 0
+        assert widget.results_model.rowCount() == 0
 
     def test_empty_search_handling(self, search_widget):
         """Test handling of empty search queries"""
@@ -316,7 +341,7 @@ class TestSearchWidget:
         QApplication.processEvents()
         
         # Should not crash, table should remain empty
-        assert widget.results_table.rowCount() == 0
+        assert widget.results_model.rowCount() == 0
 
     def test_results_table_selection(self, search_widget, sample_search_results):
         """Test selecting rows in results table"""
@@ -398,7 +423,7 @@ class TestSearchWidget:
         QTest.mouseClick(widget.search_button, Qt.MouseButton.LeftButton)
         QApplication.processEvents()
         
-        assert widget.results_table.rowCount() == 2
+        assert widget.results_model.rowCount() == 2
         
         # Second search with different results
         mock_service.search.return_value = (sample_search_results[2:], 1)
@@ -407,5 +432,5 @@ class TestSearchWidget:
         QTest.mouseClick(widget.search_button, Qt.MouseButton.LeftButton)
         QApplication.processEvents()
         
-        assert widget.results_table.rowCount() == 1
+        assert widget.results_model.rowCount() == 1
         assert mock_service.search.call_count == 2
\ No newline at end of file
@@ -18,6 +18,15 @@ from src.core.export import ExportService
 from src.models import Asset, AssetMetadata
 
 
+def _index_names(indexing):
+    """Names of the secondary indexes currently in the index database"""
+    with indexing._get_connection() as conn:
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
+        ).fetchall()
+    return {row[0] for row in rows}
+
+
 @pytest.mark.unit
 class TestFileIngestionService:
     """Test FileIngestionService class"""
@@ -104,6 +113,26 @@ class TestFileIngestionService:
         assert progress_calls[0][1] == len(sample_files)  # Total should be consistent
         assert progress_calls[-1][0] == len(sample_files)  # Last current should equal total
     
+    def test_ingest_files_batch(self, sample_archive, sample_files, sample_profile):
+        service = FileIngestionService(sample_archive)
+        metadata_list = [{"title": f"Batch {i}"} for i in range(len(sample_files))]
+        missing = sample_archive.root_path / "missing.txt"
+        
+        assets = service.ingest_files(
+            list(sample_files) + [missing],
+            profile=sample_profile,
+            custom_metadata_list=metadata_list + [{"title": "Missing"}]
+        )
+        
+        # The missing file is skipped; the rest keep their order and metadata
+        assert [a.metadata.custom_metadata["title"] for a in assets] == [
+            m["title"] for m in metadata_list
+        ]
+        assert all(a.metadata.profile_id == sample_profile.id for a in assets)
+        
+        with pytest.raises(ValueError):
+            service.ingest_files(sample_files, custom_metadata_list=[{}])
+    
     def test_organize_by_schema_date_type(self, sample_archive, sample_files):
         service = FileIngestionService(sample_archive)
         test_file = sample_files[0]  # Text file
@@ -353,6 +382,85 @@ class TestIndexingService:
             ).fetchall()
             assert len(batch_assets) == len(assets)
     
+    def test_bulk_mode_rebuilds_indexes(self, sample_archive, sample_files, sample_profile):
+        """Test bulk_mode drops secondary indexes during a load and restores them"""
+        ingestion = FileIngestionService(sample_archive)
+        indexing = IndexingService(sample_archive)
+        
+        expected = _index_names(indexing)
+        assert "idx_metadata_asset_id" in expected
+        
+        assets = [
+            ingestion.ingest_file(f, profile=sample_profile, custom_metadata={"title": f.name})
+            for f in sample_files[:3]
+        ]
+        with indexing.bulk_mode():
+            assert _index_names(indexing) == set()
+            assert indexing.index_assets_batch(assets)
+        
+        assert _index_names(indexing) == expected
+        
+        # Full-text search still sees the bulk-loaded assets
+        with indexing._get_connection() as conn:
+            fts_count = conn.execute("SELECT COUNT(*) FROM assets_fts").fetchone()[0]
+        assert fts_count == len(assets)
+    
+    def test_bulk_mode_restores_indexes_on_error(self, sample_archive, sample_files, sample_profile):
+        """Test bulk_mode rebuilds the indexes when the load raises"""
+        ingestion = FileIngestionService(sample_archive)
+        indexing = IndexingService(sample_archive)
+        
+        expected = _index_names(indexing)
+        asset = ingestion.ingest_file(sample_files[0], profile=sample_profile, custom_metadata={"title": "Partial"})
+        
+        with pytest.raises(RuntimeError):
+            with indexing.bulk_mode():
+                assert indexing.index_asset(asset)
+                raise RuntimeError("load aborted")
+        
+        assert _index_names(indexing) == expected
+        
+        # Rows written before the failure stay searchable through FTS
+        results, total = SearchService(sample_archive).search(query="Partial")
+        assert total == 1
+        assert results[0].asset_id == asset.metadata.asset_id
+        
+        # A rebuild killed before its finally block is repaired on next open
+        with indexing._get_connection() as conn:
+            conn.execute("DROP INDEX idx_assets_checksum")
+            conn.commit()
+        assert _index_names(IndexingService(sample_archive)) == expected
+    
+    def test_index_all_assets_uses_bulk_mode(self, sample_archive, sample_files, sample_profile):
+        """Test a full reindex runs without secondary indexes and restores them"""
+        ingestion = FileIngestionService(sample_archive)
+        assets = [
+            ingestion.ingest_file(f, profile=sample_profile, custom_metadata={"title": f"Bulk {i}"})
+            for i, f in enumerate(sample_files[:3])
+        ]
+        indexing = IndexingService(sample_archive)
+        
+        expected = _index_names(indexing)
+        seen_during_load = []
+        original_index_asset = indexing.index_asset
+        
+        def index_asset(asset):
+            seen_during_load.append(_index_names(indexing))
+            return original_index_asset(asset)
+        
+        with patch.object(indexing, 'index_asset', side_effect=index_asset):
+            assert indexing.index_all_assets(force_reindex=True) == (len(assets), 0)
+        
+        assert seen_during_load == [set()] * len(assets)
+        assert _index_names(indexing) == expected
+        
+        # FTS and the restored indexes agree with the reindexed rows
+        search = SearchService(sample_archive)
+        results, total = search.search(query="Bulk")
+        assert total == len(assets)
+        results, total = search.search(filters={"profile_id": sample_profile.id})
+        assert total == len(assets)
+    
     def test_index_assets_batch_partial_failure(self, sample_archive, sample_files, sample_profile):
         """Test batch indexing handles partial failures gracefully"""
         ingestion = FileIngestionService(sample_archive)
@@ -661,6 +769,17 @@ class TestSearchService:
         service = SearchService(sample_archive)
         assert db_path.exists()
     
+    def test_get_statistics_reuses_indexing_service(self, sample_archive):
+        service = SearchService(sample_archive)
+        
+        stats = service.get_statistics()
+        indexing = service._indexing_service
+        service.get_statistics()
+        
+        assert stats['total_assets'] == 0
+        assert indexing is not None
+        assert service._indexing_service is indexing
+    
     def test_search_all_assets(self, archive_with_assets):
         archive, assets = archive_with_assets
         search = SearchService(archive)
@@ -695,6 +814,24 @@ class TestSearchService:
         if len(results_page2) > 0:
             assert results[0].asset_id != results_page2[0].asset_id
     
+    def test_search_many_matches_individual_searches(self, archive_with_assets):
+        archive, assets = archive_with_assets
+        search = SearchService(archive)
+        searches = [
+            {"limit": 2},
+            {"limit": 2, "offset": 2},
+            {"filters": {"mime_type": "text/plain"}},
+            {"query": "nonexistent_term_xyz"},
+        ]
+        
+        batched = search.search_many(searches)
+        
+        assert len(batched) == len(searches)
+        for (results, total), search_kwargs in zip(batched, searches):
+            expected_results, expected_total = search.search(**search_kwargs)
+            assert total == expected_total
+            assert [r.asset_id for r in results] == [r.asset_id for r in expected_results]
+    
     def test_search_with_filters(self, archive_with_assets):
         archive, assets = archive_with_assets
         search = SearchService(archive)
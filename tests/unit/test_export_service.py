@@ -593,4 +593,17 @@ class TestExportService:
         export_dir = tmp_path / "error_export"
         if export_dir.exists():
             # Should be empty or removed
-            assert len(list(export_dir.iterdir())) == 0
\ No newline at end of file
+            assert len(list(export_dir.iterdir())) == 0
+    
+    def test_copy_file_preserves_content_and_times(self, tmp_path):
+        """Test the export copy helper matches shutil.copy2"""
+        from src.core.export import _copy_file
+        
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"export data" * 1000)
+        target = tmp_path / "target.bin"
+        
+        _copy_file(source, target)
+        
+        assert target.read_bytes() == source.read_bytes()
+        assert target.stat().st_mtime == source.stat().st_mtime
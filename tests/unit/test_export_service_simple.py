@@ -248,6 +248,25 @@ class TestExportService:
         # Should complete without error
         assert result == tmp_path / "export"
     
+    def test_bagit_export_removes_stale_staging(self, export_service, tmp_path):
+        """Test staging trees left by a killed export to the same bag are removed"""
+        export_service.search_service.search = Mock(return_value=([], 0))
+        
+        stale = tmp_path / ".bagit-out.bag-dead01"
+        (stale / "out.bag" / "data").mkdir(parents=True)
+        (stale / "out.bag" / "data" / "copied.txt").write_text("left behind")
+        other = tmp_path / ".bagit-other.bag-dead02"
+        other.mkdir()
+        
+        with patch('src.core.export.bagit'):
+            result = export_service.export_to_bagit(tmp_path / "out.bag")
+        
+        assert result.exists()
+        assert not stale.exists()
+        # Staging for other destinations is left alone
+        assert other.exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".bagit-other.bag-dead02", "out.bag", "test_archive"]
+    
     def test_bagit_metadata_defaults(self, export_service, sample_search_results):
         """Test that BagIt export includes default metadata"""
         export_service.search_service.search = Mock(return_value=(sample_search_results, 1))
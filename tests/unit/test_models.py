@@ -2,6 +2,7 @@
 Unit tests for Archive Tool models
 """
 
+import sys
 import pytest
 import json
 from pathlib import Path
@@ -57,6 +58,14 @@ class TestMetadataField:
         assert field_dict["required"] is False
         assert field_dict["default_value"] == "default"
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_field_uses_slots(self):
+        field = MetadataField(name="title", display_name="Title", field_type=FieldType.TEXT)
+        
+        assert not hasattr(field, "__dict__")
+        with pytest.raises(AttributeError):
+            field.unknown_attribute = True
+    
     def test_field_from_dict(self):
         field_data = {
             "name": "test_field",
@@ -284,6 +293,21 @@ class TestArchive:
         assert len(profiles) == 1
         assert profiles[0].name == "test_profile.json"
     
+    def test_iter_profiles(self, sample_archive, sample_profile):
+        profile_path = sample_archive.profiles_path / f"{sample_profile.id}.json"
+        sample_profile.save_to_file(profile_path)
+        (sample_archive.profiles_path / "notes.txt").write_text("not a profile")
+        (sample_archive.profiles_path / "nested.json").mkdir()
+        
+        profiles = sample_archive.iter_profiles()
+        assert not isinstance(profiles, list)
+        assert list(profiles) == [profile_path]
+    
+    def test_iter_profiles_missing_directory(self, sample_archive):
+        sample_archive.profiles_path.rmdir()
+        assert list(sample_archive.iter_profiles()) == []
+        assert sample_archive.get_profiles() == []
+    
     def test_get_asset_count(self, sample_archive, sample_files):
         # Initially no assets
         assert sample_archive.get_asset_count() == 0
@@ -395,6 +419,34 @@ class TestAsset:
         checksum2 = asset.calculate_checksum()
         assert checksum == checksum2
     
+    def test_calculate_checksum_spans_blocks(self, temp_dir):
+        import hashlib
+        from src.models.asset import CHECKSUM_BLOCK_SIZE
+        
+        test_file = temp_dir / "large.bin"
+        content = bytes(range(256)) * (CHECKSUM_BLOCK_SIZE // 256) + b"tail"
+        test_file.write_bytes(content)
+        
+        asset = Asset(test_file, temp_dir / "archive")
+        
+        assert asset.calculate_checksum() == hashlib.sha256(content).hexdigest()
+    
+    def test_copy_from_returns_checksum(self, temp_dir):
+        import hashlib
+        from src.models.asset import CHECKSUM_BLOCK_SIZE
+        
+        source = temp_dir / "source.bin"
+        content = b"x" * CHECKSUM_BLOCK_SIZE + b"tail"
+        source.write_bytes(content)
+        
+        target = temp_dir / "copy.bin"
+        asset = Asset(target, temp_dir)
+        
+        assert asset.copy_from(source) == hashlib.sha256(content).hexdigest()
+        assert target.read_bytes() == content
+        assert target.stat().st_mtime == source.stat().st_mtime
+        assert asset.calculate_checksum() == asset.copy_from(source)
+    
     def test_save_and_load_metadata(self, temp_dir):
         test_file = temp_dir / "test.txt"
         test_file.write_text("Test content")